@@ -18,13 +18,25 @@ def create_app(config_name: str = "development") -> Flask:
     from app.api.auth import auth_bp
     from app.api.students import students_bp
     from app.api.health import health_bp
+    from app.api.jobs import jobs_bp
 
     app.register_blueprint(health_bp, url_prefix="/api/v1")
-    app.register_blueprint(auth_bp, url_prefix="/api/v1/auth")
-    app.register_blueprint(students_bp, url_prefix="/api/v1/students")
+    if app.config["ASYNC_VIEWS"]:
+        from app.api.auth_async import auth_async_bp
+        from app.api.students_async import students_async_bp
+        app.register_blueprint(auth_async_bp, url_prefix="/api/v1/auth")
+        app.register_blueprint(students_async_bp, url_prefix="/api/v1/students")
+    else:
+        app.register_blueprint(auth_bp, url_prefix="/api/v1/auth")
+        app.register_blueprint(students_bp, url_prefix="/api/v1/students")
+    app.register_blueprint(jobs_bp, url_prefix="/api/v1/jobs")
 
     # Register error handlers
     from app.errors import register_error_handlers
     register_error_handlers(app)
 
+    # Register CLI commands
+    from app.cli import register_commands
+    register_commands(app)
+
     return app
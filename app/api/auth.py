@@ -1,34 +1,29 @@
 """
 Auth blueprint – register & login endpoints.
 """
-import os
 from flask import Blueprint, request, jsonify, current_app
 from app.models.user import User
-from app.repositories.json_repository import JsonRepository
+from app.repositories.factory import build_repository
+from app.schemas.user import validate_login, validate_register
 from app.services.auth_service import AuthService
 
 auth_bp = Blueprint("auth", __name__)
 
 
 def _get_service() -> AuthService:
-    data_dir = current_app.config["DATA_DIR"]
-    repo = JsonRepository[User](os.path.join(data_dir, "users.json"), User)
+    repo = build_repository(current_app.config, "users", User)
     return AuthService(repo)
 
 
 @auth_bp.route("/register", methods=["POST"])
 def register():
     """Register a new user."""
-    body = request.get_json(silent=True) or {}
-    username = body.get("username", "").strip()
-    password = body.get("password", "").strip()
-    role = body.get("role", "user").strip()
-
-    if not username or not password:
-        return jsonify({"error": "username and password are required"}), 400
+    data, errors = validate_register(request.get_json(silent=True) or {})
+    if errors:
+        return jsonify({"error": "Validation failed", "fields": errors}), 400
 
     try:
-        user = _get_service().register(username, password, role)
+        user = _get_service().register(data["username"], data["password"], data.get("role", "user"))
         return jsonify({"message": "User registered successfully", "user": user}), 201
     except ValueError as exc:
         return jsonify({"error": str(exc)}), 409
@@ -37,14 +32,11 @@ def register():
 @auth_bp.route("/login", methods=["POST"])
 def login():
     """Authenticate user and return JWT tokens."""
-    body = request.get_json(silent=True) or {}
-    username = body.get("username", "").strip()
-    password = body.get("password", "").strip()
-
-    if not username or not password:
-        return jsonify({"error": "username and password are required"}), 400
+    data, errors = validate_login(request.get_json(silent=True) or {})
+    if errors:
+        return jsonify({"error": "Validation failed", "fields": errors}), 400
 
-    result = _get_service().login(username, password)
+    result = _get_service().login(data["username"], data["password"])
     if result is None:
         return jsonify({"error": "Invalid username or password"}), 401
 
@@ -0,0 +1,46 @@
+"""
+Async auth blueprint – register & login as `async def` views over AsyncAuthService,
+so password hashing and checks run off the event loop. Registered instead of the
+sync blueprint when ASYNC_VIEWS is enabled.
+"""
+from flask import Blueprint, request, jsonify, current_app
+from app.models.user import User
+from app.repositories.async_repository import ThreadedAsyncRepository
+from app.repositories.factory import build_repository
+from app.schemas.user import validate_login, validate_register
+from app.services.auth_service import AsyncAuthService
+
+auth_async_bp = Blueprint("auth_async", __name__)
+
+
+def _get_service() -> AsyncAuthService:
+    repo = build_repository(current_app.config, "users", User)
+    return AsyncAuthService(ThreadedAsyncRepository(repo))
+
+
+@auth_async_bp.route("/register", methods=["POST"])
+async def register():
+    """Register a new user."""
+    data, errors = validate_register(request.get_json(silent=True) or {})
+    if errors:
+        return jsonify({"error": "Validation failed", "fields": errors}), 400
+
+    try:
+        user = await _get_service().register(data["username"], data["password"], data.get("role", "user"))
+        return jsonify({"message": "User registered successfully", "user": user}), 201
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 409
+
+
+@auth_async_bp.route("/login", methods=["POST"])
+async def login():
+    """Authenticate user and return JWT tokens."""
+    data, errors = validate_login(request.get_json(silent=True) or {})
+    if errors:
+        return jsonify({"error": "Validation failed", "fields": errors}), 400
+
+    result = await _get_service().login(data["username"], data["password"])
+    if result is None:
+        return jsonify({"error": "Invalid username or password"}), 401
+
+    return jsonify(result), 200
@@ -0,0 +1,55 @@
+"""
+Jobs blueprint – progress and results of background bulk jobs.
+All endpoints require JWT authentication; users only see their own jobs.
+"""
+import os
+from flask import Blueprint, jsonify, current_app, send_file
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.models.job import Job
+from app.repositories.factory import build_repository
+from app.services.job_service import JobService
+
+jobs_bp = Blueprint("jobs", __name__)
+
+_MIMETYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def get_job_service() -> JobService:
+    config = current_app.config
+    return JobService(
+        build_repository(config, "jobs", Job),
+        os.path.join(config["DATA_DIR"], "jobs"),
+        chunk_size=config["BULK_CHUNK_SIZE"],
+        max_workers=config["BULK_JOB_WORKERS"],
+        flush_rows=config["BULK_FLUSH_ROWS"],
+        stale_seconds=config["JOB_STALE_SECONDS"],
+        retention_seconds=config["JOB_RETENTION_SECONDS"],
+    )
+
+
+@jobs_bp.route("/<string:job_id>", methods=["GET"])
+@jwt_required()
+def get_job(job_id: str):
+    """Poll a job's status and progress."""
+    job = get_job_service().get_job(job_id, get_jwt_identity())
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job), 200
+
+
+@jobs_bp.route("/<string:job_id>/result", methods=["GET"])
+@jwt_required()
+def download_result(job_id: str):
+    """Stream the job's result file (export data, or the import error report)."""
+    service = get_job_service()
+    job = service.get_job(job_id, get_jwt_identity())
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    path = service.result_path(job)
+    if path is None:
+        return jsonify({"error": f"Job is {job['status']}; no result available"}), 409
+
+    fmt = "ndjson" if job["kind"] == "import" else job["format"]
+    suffix = "import-errors" if job["kind"] == "import" else "export"
+    return send_file(path, mimetype=_MIMETYPES[fmt], as_attachment=True,
+                     download_name=f"students-{suffix}.{fmt}")
@@ -2,22 +2,59 @@
 Students blueprint – full CRUD for student records.
 All endpoints require JWT authentication.
 """
-import os
-from flask import Blueprint, request, jsonify, current_app
-from flask_jwt_extended import jwt_required
+from typing import Optional
+from flask import Blueprint, request, jsonify, current_app, url_for
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.api.jobs import get_job_service
 from app.models.student import Student
-from app.repositories.json_repository import JsonRepository
+from app.repositories.base_repository import VersionConflictError
+from app.repositories.factory import build_repository
+from app.schemas.student import validate_student_create, validate_student_update
 from app.services.student_service import StudentService
 
 students_bp = Blueprint("students", __name__)
 
 
 def _get_service() -> StudentService:
-    data_dir = current_app.config["DATA_DIR"]
-    repo = JsonRepository[Student](os.path.join(data_dir, "students.json"), Student)
+    config = current_app.config
+    repo = build_repository(config, "students", Student, shards=config["STUDENT_SHARDS"])
     return StudentService(repo)
 
 
+def _with_etag(response, student: dict):
+    """Expose the record version as a strong ETag for use in If-Match."""
+    response.set_etag(str(student["version"]))
+    return response
+
+
+def _removed_fields(body) -> dict[str, str]:
+    """Merge Patch null members, which would remove fields a student must have."""
+    if not isinstance(body, dict):
+        return {}
+    return {name: f"{name} cannot be removed" for name, value in body.items() if value is None}
+
+
+def _version_conflict(exc: VersionConflictError):
+    return jsonify({
+        "error": "Student was modified by another request",
+        "current_version": exc.current_version,
+    }), 412
+
+
+def _expected_version() -> Optional[int]:
+    """
+    Record version from the If-Match header.
+    None means unconditional (header absent or '*'); raises ValueError if malformed.
+    """
+    if_match = request.if_match
+    if not if_match or if_match.star_tag:
+        return None
+    tags = if_match.as_set()
+    if len(tags) != 1 or not next(iter(tags)).isdigit():
+        raise ValueError("If-Match must carry a single record version")
+    return int(next(iter(tags)))
+
+
 @students_bp.route("", methods=["GET"])
 @jwt_required()
 def list_students():
@@ -33,22 +70,20 @@ def get_student(student_id: str):
     student = _get_service().get_student(student_id)
     if student is None:
         return jsonify({"error": "Student not found"}), 404
-    return jsonify(student), 200
+    return _with_etag(jsonify(student), student), 200
 
 
 @students_bp.route("", methods=["POST"])
 @jwt_required()
 def create_student():
     """Create a new student."""
-    body = request.get_json(silent=True) or {}
-    required_fields = ("first_name", "last_name", "email", "course")
-    missing = [f for f in required_fields if not body.get(f, "").strip()]
-    if missing:
-        return jsonify({"error": f"Missing fields: {', '.join(missing)}"}), 400
+    data, errors = validate_student_create(request.get_json(silent=True) or {})
+    if errors:
+        return jsonify({"error": "Validation failed", "fields": errors}), 400
 
     try:
-        student = _get_service().create_student(body)
-        return jsonify({"message": "Student created", "student": student}), 201
+        student = _get_service().create_student(data)
+        return _with_etag(jsonify({"message": "Student created", "student": student}), student), 201
     except ValueError as exc:
         return jsonify({"error": str(exc)}), 409
 
@@ -56,12 +91,54 @@ def create_student():
 @students_bp.route("/<string:student_id>", methods=["PUT"])
 @jwt_required()
 def update_student(student_id: str):
-    """Update an existing student."""
-    body = request.get_json(silent=True) or {}
-    result = _get_service().update_student(student_id, body)
+    """Update an existing student; honours If-Match like PATCH."""
+    try:
+        expected_version = _expected_version()
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    data, errors = validate_student_update(request.get_json(silent=True) or {})
+    if errors:
+        return jsonify({"error": "Validation failed", "fields": errors}), 400
+
+    try:
+        result = _get_service().update_student(student_id, data, expected_version)
+    except VersionConflictError as exc:
+        return _version_conflict(exc)
     if result is None:
         return jsonify({"error": "Student not found"}), 404
-    return jsonify({"message": "Student updated", "student": result}), 200
+    return _with_etag(jsonify({"message": "Student updated", "student": result}), result), 200
+
+
+@students_bp.route("/<string:student_id>", methods=["PATCH"])
+@jwt_required()
+def patch_student(student_id: str):
+    """
+    Partially update a student (JSON Merge Patch, RFC 7396).
+    Every student field is required, so null (remove) members are rejected.
+    Send If-Match with the version from the ETag to reject concurrent edits.
+    """
+    try:
+        expected_version = _expected_version()
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    body = request.get_json(silent=True)
+    removed = _removed_fields(body)
+    if removed:
+        return jsonify({"error": "Student fields cannot be removed", "fields": removed}), 400
+
+    data, errors = validate_student_update(body)
+    if errors:
+        return jsonify({"error": "Validation failed", "fields": errors}), 400
+
+    try:
+        result = _get_service().patch_student(student_id, data, expected_version)
+    except VersionConflictError as exc:
+        return _version_conflict(exc)
+    if result is None:
+        return jsonify({"error": "Student not found"}), 404
+    return _with_etag(jsonify({"message": "Student updated", "student": result}), result), 200
 
 
 @students_bp.route("/<string:student_id>", methods=["DELETE"])
@@ -71,3 +148,40 @@ def delete_student(student_id: str):
     if _get_service().delete_student(student_id):
         return jsonify({"message": "Student deleted"}), 200
     return jsonify({"error": "Student not found"}), 404
+
+
+@students_bp.route("/import", methods=["POST"])
+@jwt_required()
+def import_students():
+    """
+    Queue a bulk import. Send NDJSON or CSV as a multipart `file` or as the raw
+    body; the format comes from ?format=, else the content type / file name.
+    """
+    if request.mimetype == "multipart/form-data":
+        upload = request.files.get("file")
+        if upload is None:
+            return jsonify({"error": "Missing upload field: file"}), 400
+        source, is_csv = upload.stream, upload.mimetype == "text/csv" or (upload.filename or "").endswith(".csv")
+    else:
+        source, is_csv = request.stream, request.mimetype == "text/csv"
+    fmt = request.args.get("format") or ("csv" if is_csv else "ndjson")
+
+    try:
+        job = get_job_service().start_import(get_jwt_identity(), fmt, source, _get_service())
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    location = url_for("jobs.get_job", job_id=job["id"])
+    return jsonify({"message": "Import queued", "job": job}), 202, {"Location": location}
+
+
+@students_bp.route("/export", methods=["POST"])
+@jwt_required()
+def export_students():
+    """Queue a bulk export (?format=ndjson|csv); download it from the job's result."""
+    fmt = request.args.get("format", "ndjson")
+    try:
+        job = get_job_service().start_export(get_jwt_identity(), fmt, _get_service())
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    location = url_for("jobs.get_job", job_id=job["id"])
+    return jsonify({"message": "Export queued", "job": job}), 202, {"Location": location}
@@ -0,0 +1,121 @@
+"""
+Async students blueprint – the student CRUD routes as `async def` views over the
+async service/repository stack. Registered instead of the sync blueprint when
+ASYNC_VIEWS is enabled; the bulk import/export routes are shared with it.
+All endpoints require JWT authentication.
+"""
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import jwt_required
+from app.api.students import (
+    _expected_version, _removed_fields, _version_conflict, _with_etag, export_students, import_students,
+)
+from app.models.student import Student
+from app.repositories.async_repository import ThreadedAsyncRepository
+from app.repositories.base_repository import VersionConflictError
+from app.repositories.factory import build_repository
+from app.schemas.student import validate_student_create, validate_student_update
+from app.services.student_service import AsyncStudentService
+
+students_async_bp = Blueprint("students_async", __name__)
+students_async_bp.add_url_rule("/import", view_func=import_students, methods=["POST"])
+students_async_bp.add_url_rule("/export", view_func=export_students, methods=["POST"])
+
+
+def _get_service() -> AsyncStudentService:
+    config = current_app.config
+    repo = build_repository(config, "students", Student, shards=config["STUDENT_SHARDS"])
+    return AsyncStudentService(ThreadedAsyncRepository(repo))
+
+
+@students_async_bp.route("", methods=["GET"])
+@jwt_required()
+async def list_students():
+    """List all students."""
+    students = await _get_service().list_students()
+    return jsonify({"count": len(students), "students": students}), 200
+
+
+@students_async_bp.route("/<string:student_id>", methods=["GET"])
+@jwt_required()
+async def get_student(student_id: str):
+    """Get a single student by ID."""
+    student = await _get_service().get_student(student_id)
+    if student is None:
+        return jsonify({"error": "Student not found"}), 404
+    return _with_etag(jsonify(student), student), 200
+
+
+@students_async_bp.route("", methods=["POST"])
+@jwt_required()
+async def create_student():
+    """Create a new student."""
+    data, errors = validate_student_create(request.get_json(silent=True) or {})
+    if errors:
+        return jsonify({"error": "Validation failed", "fields": errors}), 400
+
+    try:
+        student = await _get_service().create_student(data)
+        return _with_etag(jsonify({"message": "Student created", "student": student}), student), 201
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 409
+
+
+@students_async_bp.route("/<string:student_id>", methods=["PUT"])
+@jwt_required()
+async def update_student(student_id: str):
+    """Update an existing student; honours If-Match like PATCH."""
+    try:
+        expected_version = _expected_version()
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    data, errors = validate_student_update(request.get_json(silent=True) or {})
+    if errors:
+        return jsonify({"error": "Validation failed", "fields": errors}), 400
+
+    try:
+        result = await _get_service().update_student(student_id, data, expected_version)
+    except VersionConflictError as exc:
+        return _version_conflict(exc)
+    if result is None:
+        return jsonify({"error": "Student not found"}), 404
+    return _with_etag(jsonify({"message": "Student updated", "student": result}), result), 200
+
+
+@students_async_bp.route("/<string:student_id>", methods=["PATCH"])
+@jwt_required()
+async def patch_student(student_id: str):
+    """
+    Partially update a student (JSON Merge Patch, RFC 7396) with optional If-Match.
+    Every student field is required, so null (remove) members are rejected.
+    """
+    try:
+        expected_version = _expected_version()
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    body = request.get_json(silent=True)
+    removed = _removed_fields(body)
+    if removed:
+        return jsonify({"error": "Student fields cannot be removed", "fields": removed}), 400
+
+    data, errors = validate_student_update(body)
+    if errors:
+        return jsonify({"error": "Validation failed", "fields": errors}), 400
+
+    try:
+        result = await _get_service().patch_student(student_id, data, expected_version)
+    except VersionConflictError as exc:
+        return _version_conflict(exc)
+    if result is None:
+        return jsonify({"error": "Student not found"}), 404
+    return _with_etag(jsonify({"message": "Student updated", "student": result}), result), 200
+
+
+@students_async_bp.route("/<string:student_id>", methods=["DELETE"])
+@jwt_required()
+async def delete_student(student_id: str):
+    """Delete a student."""
+    if await _get_service().delete_student(student_id):
+        return jsonify({"message": "Student deleted"}), 200
+    return jsonify({"error": "Student not found"}), 404
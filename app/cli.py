@@ -0,0 +1,64 @@
+"""
+Flask CLI commands (run with `flask --app run <command>`).
+"""
+import os
+
+import click
+from flask import Flask
+
+from app.repositories.sharded_repository import reshard
+from app.repositories.snapshot import json_to_snapshot, snapshot_to_json
+
+COLLECTIONS = ("students", "users", "jobs")
+
+
+def register_commands(app: Flask) -> None:
+    """Register maintenance commands on the app CLI."""
+
+    @app.cli.command("reshard")
+    @click.argument("shards", type=click.IntRange(min=0))
+    def reshard_students(shards: int) -> None:
+        """Redistribute student records across SHARDS files (0 = single file).
+
+        Offline operation: stop the API first, then set STUDENT_SHARDS to match.
+        """
+        data_dir = app.config["DATA_DIR"]
+        try:
+            moved = reshard(
+                os.path.join(data_dir, "students.json"),
+                os.path.join(data_dir, "students_shards"),
+                shards,
+            )
+        except ValueError as exc:
+            raise click.ClickException(str(exc))
+        layout = f"{shards} shards" if shards else "students.json"
+        click.echo(f"Moved {moved} student records into {layout}.")
+        click.echo(f"Set STUDENT_SHARDS={shards} before restarting the API.")
+
+    @app.cli.group("snapshot")
+    def snapshot() -> None:
+        """Convert collections between JSON and binary snapshot files."""
+
+    @snapshot.command("build")
+    @click.argument("collections", nargs=-1, type=click.Choice(COLLECTIONS))
+    def build_snapshot(collections: tuple[str, ...]) -> None:
+        """Write <name>.snap from <name>.json (every existing collection by default)."""
+        data_dir = app.config["DATA_DIR"]
+        for name in collections or COLLECTIONS:
+            if not collections and not os.path.exists(os.path.join(data_dir, f"{name}.json")):
+                continue
+            count = json_to_snapshot(os.path.join(data_dir, f"{name}.json"),
+                                     os.path.join(data_dir, f"{name}.snap"))
+            click.echo(f"{name}: wrote {count} records to {name}.snap")
+
+    @snapshot.command("dump")
+    @click.argument("collections", nargs=-1, type=click.Choice(COLLECTIONS))
+    def dump_snapshot(collections: tuple[str, ...]) -> None:
+        """Write <name>.json from <name>.snap (every existing collection by default)."""
+        data_dir = app.config["DATA_DIR"]
+        for name in collections or COLLECTIONS:
+            if not collections and not os.path.exists(os.path.join(data_dir, f"{name}.snap")):
+                continue
+            count = snapshot_to_json(os.path.join(data_dir, f"{name}.snap"),
+                                     os.path.join(data_dir, f"{name}.json"))
+            click.echo(f"{name}: wrote {count} records to {name}.json")
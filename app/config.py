@@ -23,6 +23,29 @@ class BaseConfig:
         os.path.join(os.path.dirname(os.path.dirname(__file__)), "data"),
     )
 
+    # Collection file format: "json" or "snapshot" (mmap'd binary, see `flask snapshot`)
+    STORAGE_FORMAT = os.environ.get("STORAGE_FORMAT", "json")
+
+    # Student storage shards (0 = single students.json; change with `flask reshard`)
+    STUDENT_SHARDS = int(os.environ.get("STUDENT_SHARDS", 0))
+
+    # Bulk import/export jobs: rows per chunk, imported rows buffered per store
+    # write (each write rewrites the collection), and background worker threads
+    BULK_CHUNK_SIZE = int(os.environ.get("BULK_CHUNK_SIZE", 1000))
+    BULK_FLUSH_ROWS = int(os.environ.get("BULK_FLUSH_ROWS", 50_000))
+    BULK_JOB_WORKERS = int(os.environ.get("BULK_JOB_WORKERS", 2))
+
+    # A running job with no progress write for this long is treated as orphaned;
+    # finished jobs and their files are purged this long after they finish
+    JOB_STALE_SECONDS = int(os.environ.get("JOB_STALE_SECONDS", 600))
+    JOB_RETENTION_SECONDS = int(os.environ.get("JOB_RETENTION_SECONDS", 24 * 3600))
+
+    # Serve auth and student CRUD from async views (needs Flask[async])
+    ASYNC_VIEWS = os.environ.get("ASYNC_VIEWS", "false").lower() == "true"
+
+    # Load collections when wsgi.py is imported so forked gunicorn workers share them
+    WARM_STORE = os.environ.get("WARM_STORE", "true").lower() == "true"
+
 
 class DevelopmentConfig(BaseConfig):
     """Development configuration."""
@@ -0,0 +1,40 @@
+"""
+Background job model (bulk import / export).
+"""
+from __future__ import annotations
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timezone
+from typing import Optional
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    format: str
+    owner: str
+    status: str = "queued"
+    processed: int = 0
+    failed: int = 0
+    imported: int = 0
+    errors: list = field(default_factory=list)
+    message: Optional[str] = None
+    result_file: Optional[str] = None
+    created_at: str = field(default_factory=_now)
+    finished_at: Optional[str] = None
+    # process that runs the job, and its last progress write, to detect orphans
+    host: Optional[str] = None
+    pid: Optional[int] = None
+    heartbeat_at: Optional[str] = None
+    version: int = 1
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Job:
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
@@ -2,7 +2,7 @@
 Student model.
 """
 from __future__ import annotations
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 
@@ -15,9 +15,11 @@ class Student:
     course: str
     enrollment_date: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     is_active: bool = True
+    version: int = 1
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # All fields are scalars, so a shallow copy equals asdict() without its deepcopy cost
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
 
     @classmethod
     def from_dict(cls, data: dict) -> Student:
@@ -28,4 +28,4 @@ class User:
 
     @classmethod
     def from_dict(cls, data: dict) -> User:
-        return cls(**data)
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
@@ -0,0 +1,42 @@
+"""
+Abstract async repository – the awaitable counterpart of BaseRepository for
+async views and services.
+"""
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar, Optional
+
+T = TypeVar("T")
+
+
+class AsyncBaseRepository(ABC, Generic[T]):
+    """Interface for awaitable CRUD operations."""
+
+    @abstractmethod
+    async def get_all(self) -> list[T]:
+        ...
+
+    @abstractmethod
+    async def get_by_id(self, entity_id: str) -> Optional[T]:
+        ...
+
+    @abstractmethod
+    async def get_by_field(self, field: str, value: str) -> Optional[T]:
+        ...
+
+    @abstractmethod
+    async def create(self, entity: T) -> T:
+        ...
+
+    @abstractmethod
+    async def update(self, entity_id: str, entity: T) -> Optional[T]:
+        ...
+
+    @abstractmethod
+    async def update_fields(
+        self, entity_id: str, changes: dict, expected_version: Optional[int] = None
+    ) -> Optional[T]:
+        ...
+
+    @abstractmethod
+    async def delete(self, entity_id: str) -> bool:
+        ...
@@ -0,0 +1,43 @@
+"""
+Async adapter over any synchronous repository.
+Every call runs on a worker thread via asyncio.to_thread, so blocking file I/O
+and JSON parsing never stall the event loop. The wrapped repository's locks
+still serialise writers.
+"""
+import asyncio
+from typing import Optional, TypeVar
+
+from app.repositories.async_base_repository import AsyncBaseRepository
+from app.repositories.base_repository import BaseRepository
+
+T = TypeVar("T")
+
+
+class ThreadedAsyncRepository(AsyncBaseRepository[T]):
+    """Runs a BaseRepository's blocking methods off the event loop."""
+
+    def __init__(self, repo: BaseRepository[T]) -> None:
+        self._repo = repo
+
+    async def get_all(self) -> list[T]:
+        return await asyncio.to_thread(self._repo.get_all)
+
+    async def get_by_id(self, entity_id: str) -> Optional[T]:
+        return await asyncio.to_thread(self._repo.get_by_id, entity_id)
+
+    async def get_by_field(self, field: str, value: str) -> Optional[T]:
+        return await asyncio.to_thread(self._repo.get_by_field, field, value)
+
+    async def create(self, entity: T) -> T:
+        return await asyncio.to_thread(self._repo.create, entity)
+
+    async def update(self, entity_id: str, entity: T) -> Optional[T]:
+        return await asyncio.to_thread(self._repo.update, entity_id, entity)
+
+    async def update_fields(
+        self, entity_id: str, changes: dict, expected_version: Optional[int] = None
+    ) -> Optional[T]:
+        return await asyncio.to_thread(self._repo.update_fields, entity_id, changes, expected_version)
+
+    async def delete(self, entity_id: str) -> bool:
+        return await asyncio.to_thread(self._repo.delete, entity_id)
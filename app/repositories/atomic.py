@@ -0,0 +1,87 @@
+"""
+Atomic file replacement and cross-process file locking shared by the
+file-backed repositories.
+"""
+import fcntl
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import IO, Callable, Iterator
+
+
+class FileLock:
+    """
+    Lock for one data file.
+    `with lock:` takes only the in-process thread lock, which keeps the process's
+    cache consistent for readers. `with lock.exclusive():` also takes an flock on
+    the sidecar `<file>.lock`, so a read-modify-write is serialised across
+    gunicorn worker processes as well as threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._thread_lock = threading.Lock()
+        self._lock_path = path + ".lock"
+
+    def __enter__(self) -> "FileLock":
+        self._thread_lock.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._thread_lock.release()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        with self._thread_lock:
+            # opened per acquisition: flock is per open file description, so a
+            # descriptor inherited through fork would be shared with the parent
+            fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                os.close(fd)
+
+
+# Repositories are built per request, so locks are shared per file path.
+_file_locks: dict[str, FileLock] = {}
+_file_locks_guard = threading.Lock()
+
+
+def file_lock(filepath: str) -> FileLock:
+    key = os.path.abspath(filepath)
+    with _file_locks_guard:
+        lock = _file_locks.get(key)
+        if lock is None:
+            lock = _file_locks[key] = FileLock(key)
+        return lock
+
+
+def stat_key(stat: os.stat_result) -> tuple:
+    """Identity of one version of a file; rename keeps inode and mtime intact."""
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def atomic_write(path: str, write: Callable[[IO], None], binary: bool = False) -> tuple:
+    """
+    Write via a uniquely named temp file in the same directory, then rename it over
+    `path`. Returns the stat_key of the new file, taken from the temp file's own
+    descriptor so a concurrent replace by another process cannot be mistaken for it.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        # mkstemp creates 0600; keep the permissions a plain open() would give
+        umask = os.umask(0)
+        os.umask(umask)
+        os.fchmod(fd, 0o666 & ~umask)
+        with os.fdopen(fd, "wb" if binary else "w", **({} if binary else {"encoding": "utf-8"})) as f:
+            write(f)
+            f.flush()
+            key = stat_key(os.fstat(f.fileno()))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return key
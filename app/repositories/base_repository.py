@@ -3,14 +3,34 @@ Abstract base repository – defines the contract every data-store must fulfil.
 Swap the JSON implementation for SQLAlchemy / MongoDB later without touching API code.
 """
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional
+from typing import Generic, Iterator, TypeVar, Optional
 
 T = TypeVar("T")
 
 
+class VersionConflictError(Exception):
+    """Raised when a conditional write finds a newer record version."""
+
+    def __init__(self, current_version: int) -> None:
+        super().__init__(f"Record is at version {current_version}")
+        self.current_version = current_version
+
+
 class BaseRepository(ABC, Generic[T]):
     """Interface for CRUD operations."""
 
+    def warm(self) -> None:
+        """Load the backing store into memory ahead of traffic (optional)."""
+
+    def iter_all(self) -> Iterator[T]:
+        """Iterate every entity; stores that can stream override this."""
+        yield from self.get_all()
+
+    def bulk_create(self, entities: list[T]) -> None:
+        """Insert many entities; stores override this to write them in one pass."""
+        for entity in entities:
+            self.create(entity)
+
     @abstractmethod
     def get_all(self) -> list[T]:
         ...
@@ -19,6 +39,10 @@ class BaseRepository(ABC, Generic[T]):
     def get_by_id(self, entity_id: str) -> Optional[T]:
         ...
 
+    @abstractmethod
+    def get_by_field(self, field: str, value: str) -> Optional[T]:
+        ...
+
     @abstractmethod
     def create(self, entity: T) -> T:
         ...
@@ -27,6 +51,16 @@ class BaseRepository(ABC, Generic[T]):
     def update(self, entity_id: str, entity: T) -> Optional[T]:
         ...
 
+    @abstractmethod
+    def update_fields(
+        self, entity_id: str, changes: dict, expected_version: Optional[int] = None
+    ) -> Optional[T]:
+        """
+        Atomically merge `changes` into a record and bump its version.
+        Raises VersionConflictError when expected_version is given and stale.
+        """
+        ...
+
     @abstractmethod
     def delete(self, entity_id: str) -> bool:
         ...
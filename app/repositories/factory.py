@@ -0,0 +1,36 @@
+"""
+Builds the configured repository for a collection so the API layer does not
+need to know about storage layouts.
+"""
+import os
+from typing import Mapping, Type, TypeVar
+
+from app.models.student import Student
+from app.models.user import User
+
+from app.repositories.base_repository import BaseRepository
+from app.repositories.json_repository import JsonRepository
+from app.repositories.sharded_repository import ShardedJsonRepository
+from app.repositories.snapshot_repository import SnapshotRepository
+
+T = TypeVar("T")
+
+
+def build_repository(config: Mapping, name: str, model_cls: Type[T], shards: int = 0) -> BaseRepository[T]:
+    """
+    Repository for collection `name` under DATA_DIR.
+    shards > 0 selects the sharded JSON layout; otherwise STORAGE_FORMAT picks
+    between `<name>.json` and the binary `<name>.snap`.
+    """
+    data_dir = config["DATA_DIR"]
+    if shards:
+        return ShardedJsonRepository[T](os.path.join(data_dir, f"{name}_shards"), model_cls, shards)
+    if config["STORAGE_FORMAT"] == "snapshot":
+        return SnapshotRepository[T](os.path.join(data_dir, f"{name}.snap"), model_cls)
+    return JsonRepository[T](os.path.join(data_dir, f"{name}.json"), model_cls)
+
+
+def warm_repositories(config: Mapping) -> None:
+    """Load every collection the API serves, e.g. in the gunicorn master before fork."""
+    build_repository(config, "students", Student, shards=config["STUDENT_SHARDS"]).warm()
+    build_repository(config, "users", User).warm()
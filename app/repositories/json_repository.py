@@ -4,33 +4,77 @@ Drop-in replacement: implement BaseRepository with SQLAlchemy to switch to a rea
 """
 import json
 import os
-import threading
-from typing import Optional, TypeVar, Type
+from typing import Iterator, NamedTuple, Optional, TypeVar, Type
 
-from app.repositories.base_repository import BaseRepository
+from app.repositories.atomic import atomic_write, file_lock, stat_key
+from app.repositories.base_repository import BaseRepository, VersionConflictError
 
 T = TypeVar("T")
 
 
+class _Collection(NamedTuple):
+    """Parsed file contents, valid while the file's stat_key is unchanged."""
+    stat_key: tuple
+    records: tuple[dict, ...]
+    by_id: dict[str, dict]
+
+
+# Parsed collections shared by every repository instance in the process. Built in
+# the gunicorn master under --preload, they are inherited by workers via fork.
+_collections: dict[str, _Collection] = {}
+
+
+def _load_collection(path: str) -> _Collection:
+    cached = _collections.get(path)
+    if cached is not None and cached.stat_key == stat_key(os.stat(path)):
+        return cached
+    with open(path, "r", encoding="utf-8") as f:
+        # key the parse by the descriptor actually read, not a separate stat()
+        key = stat_key(os.fstat(f.fileno()))
+        records = tuple(json.load(f))
+    collection = _Collection(key, records, {r.get("id"): r for r in records})
+    _collections[path] = collection
+    return collection
+
+
+def refresh_collections() -> list[str]:
+    """Reload cached collections whose files changed; returns the refreshed paths."""
+    refreshed = []
+    for path, cached in list(_collections.items()):
+        with file_lock(path):
+            if not os.path.exists(path):
+                _collections.pop(path, None)
+            elif stat_key(os.stat(path)) != cached.stat_key:
+                _load_collection(path)
+                refreshed.append(path)
+    return refreshed
+
+
 class JsonRepository(BaseRepository[T]):
     """Thread-safe JSON-file data store."""
 
     def __init__(self, filepath: str, model_cls: Type[T]) -> None:
-        self._filepath = filepath
+        self._filepath = os.path.abspath(filepath)
         self._model_cls = model_cls
-        self._lock = threading.Lock()
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        if not os.path.exists(filepath):
-            self._write([])
+        self._lock = file_lock(filepath)
+        os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+        with self._lock.exclusive():
+            if not os.path.exists(self._filepath):
+                self._write([])
 
     # ---- internal helpers ----
+    def _collection(self) -> _Collection:
+        """Cached parse of the file; re-read only when the file has changed."""
+        return _load_collection(self._filepath)
+
     def _read(self) -> list[dict]:
-        with open(self._filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        """Working copy for a write; records are shared, so replace rather than mutate."""
+        return list(self._collection().records)
 
     def _write(self, data: list[dict]) -> None:
-        with open(self._filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        key = atomic_write(self._filepath, lambda f: json.dump(data, f, indent=2, ensure_ascii=False))
+        records = tuple(data)
+        _collections[self._filepath] = _Collection(key, records, {r.get("id"): r for r in records})
 
     def _to_model(self, data: dict) -> T:
         return self._model_cls.from_dict(data)  # type: ignore[attr-defined]
@@ -39,34 +83,50 @@ class JsonRepository(BaseRepository[T]):
         return entity.to_dict(include_hash=True) if hasattr(entity, "password_hash") else entity.to_dict()  # type: ignore[attr-defined]
 
     # ---- public CRUD ----
+    def warm(self) -> None:
+        with self._lock:
+            self._collection()
+
     def get_all(self) -> list[T]:
         with self._lock:
-            return [self._to_model(d) for d in self._read()]
+            return [self._to_model(d) for d in self._collection().records]
+
+    def iter_all(self) -> Iterator[T]:
+        with self._lock:
+            records = self._collection().records
+        for item in records:
+            yield self._to_model(item)
 
     def get_by_id(self, entity_id: str) -> Optional[T]:
         with self._lock:
-            for item in self._read():
-                if item.get("id") == entity_id:
-                    return self._to_model(item)
-        return None
+            item = self._collection().by_id.get(entity_id)
+        return self._to_model(item) if item is not None else None
 
     def get_by_field(self, field: str, value: str) -> Optional[T]:
         """Lookup by any field (e.g., username)."""
+        if field == "id":
+            return self.get_by_id(value)
         with self._lock:
-            for item in self._read():
+            for item in self._collection().records:
                 if item.get(field) == value:
                     return self._to_model(item)
         return None
 
     def create(self, entity: T) -> T:
-        with self._lock:
+        with self._lock.exclusive():
             data = self._read()
             data.append(self._to_dict(entity))
             self._write(data)
         return entity
 
+    def bulk_create(self, entities: list[T]) -> None:
+        with self._lock.exclusive():
+            data = self._read()
+            data.extend(self._to_dict(e) for e in entities)
+            self._write(data)
+
     def update(self, entity_id: str, entity: T) -> Optional[T]:
-        with self._lock:
+        with self._lock.exclusive():
             data = self._read()
             for i, item in enumerate(data):
                 if item.get("id") == entity_id:
@@ -75,8 +135,24 @@ class JsonRepository(BaseRepository[T]):
                     return entity
         return None
 
+    def update_fields(
+        self, entity_id: str, changes: dict, expected_version: Optional[int] = None
+    ) -> Optional[T]:
+        """Read, check version, merge and write under one cross-process lock hold."""
+        with self._lock.exclusive():
+            data = self._read()
+            for i, item in enumerate(data):
+                if item.get("id") == entity_id:
+                    current = item.get("version", 1)
+                    if expected_version is not None and expected_version != current:
+                        raise VersionConflictError(current)
+                    data[i] = item = {**item, **changes, "id": entity_id, "version": current + 1}
+                    self._write(data)
+                    return self._to_model(item)
+        return None
+
     def delete(self, entity_id: str) -> bool:
-        with self._lock:
+        with self._lock.exclusive():
             data = self._read()
             new_data = [d for d in data if d.get("id") != entity_id]
             if len(new_data) == len(data):
@@ -0,0 +1,184 @@
+"""
+Hash-partitioned JSON repository.
+Records are spread across N JsonRepository shard files by a stable hash of their
+id, so a write only rewrites its own shard and writers on different shards do not
+contend for the same lock. Each shard is a JsonRepository, so its writes hold that
+shard's own <shard>.lock flock and are safe across worker processes too.
+Collection-wide reads fan out across every shard.
+"""
+import json
+import os
+import shutil
+import zlib
+from typing import Iterator, Optional, TypeVar, Type
+
+from app.repositories.base_repository import BaseRepository
+from app.repositories.json_repository import JsonRepository
+
+T = TypeVar("T")
+
+META_FILE = "_meta.json"
+
+
+def shard_index(entity_id: str, shard_count: int) -> int:
+    """Stable shard for an id (crc32, so it is identical across processes)."""
+    return zlib.crc32(entity_id.encode("utf-8")) % shard_count
+
+
+def _shard_path(shard_dir: str, index: int) -> str:
+    return os.path.join(shard_dir, f"shard_{index:03d}.json")
+
+
+def _read_meta(shard_dir: str) -> Optional[dict]:
+    path = os.path.join(shard_dir, META_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class ShardedJsonRepository(BaseRepository[T]):
+    """Thread-safe JSON store split into independently locked shard files."""
+
+    def __init__(self, shard_dir: str, model_cls: Type[T], shard_count: int) -> None:
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+        # Only reshard() creates a layout, so a missing one is a configuration
+        # error rather than an empty collection (the roster may be in the JSON file).
+        meta = _read_meta(shard_dir)
+        if meta is None:
+            raise RuntimeError(
+                f"{shard_dir} has no shard layout; run `flask reshard {shard_count}` first"
+            )
+        if meta["shards"] != shard_count:
+            raise RuntimeError(
+                f"{shard_dir} holds {meta['shards']} shards but {shard_count} are configured; "
+                "run `flask reshard` first"
+            )
+        self._shard_count = shard_count
+        self._shards = [
+            JsonRepository[T](_shard_path(shard_dir, i), model_cls) for i in range(shard_count)
+        ]
+
+    # ---- internal helpers ----
+    def _shard_for(self, entity_id: str) -> JsonRepository[T]:
+        return self._shards[shard_index(entity_id, self._shard_count)]
+
+    # ---- public CRUD ----
+    def warm(self) -> None:
+        for shard in self._shards:
+            shard.warm()
+
+    def get_all(self) -> list[T]:
+        results: list[T] = []
+        for shard in self._shards:
+            results.extend(shard.get_all())
+        return results
+
+    def iter_all(self) -> Iterator[T]:
+        for shard in self._shards:
+            yield from shard.iter_all()
+
+    def get_by_id(self, entity_id: str) -> Optional[T]:
+        return self._shard_for(entity_id).get_by_id(entity_id)
+
+    def get_by_field(self, field: str, value: str) -> Optional[T]:
+        """Lookup by any field; ids route to one shard, others fan out."""
+        if field == "id":
+            return self.get_by_id(value)
+        for shard in self._shards:
+            found = shard.get_by_field(field, value)
+            if found is not None:
+                return found
+        return None
+
+    def create(self, entity: T) -> T:
+        return self._shard_for(entity.id).create(entity)  # type: ignore[attr-defined]
+
+    def bulk_create(self, entities: list[T]) -> None:
+        """One write per touched shard."""
+        buckets: dict[int, list[T]] = {}
+        for entity in entities:
+            index = shard_index(entity.id, self._shard_count)  # type: ignore[attr-defined]
+            buckets.setdefault(index, []).append(entity)
+        for index, bucket in buckets.items():
+            self._shards[index].bulk_create(bucket)
+
+    def update(self, entity_id: str, entity: T) -> Optional[T]:
+        return self._shard_for(entity_id).update(entity_id, entity)
+
+    def update_fields(
+        self, entity_id: str, changes: dict, expected_version: Optional[int] = None
+    ) -> Optional[T]:
+        return self._shard_for(entity_id).update_fields(entity_id, changes, expected_version)
+
+    def delete(self, entity_id: str) -> bool:
+        return self._shard_for(entity_id).delete(entity_id)
+
+
+def reshard(source: str, shard_dir: str, shard_count: int) -> int:
+    """
+    Offline: redistribute every record into `shard_count` shards under shard_dir.
+    Records come from the existing shards or from the single JSON file `source`,
+    whichever holds them; if both do, nothing is changed and ValueError is raised.
+    shard_count=0 merges the shards back into `source`. After moving records out
+    of `source` it is renamed to `<source>.pre-shard` so it cannot be served stale.
+    The new layout is written to a sibling directory and swapped in, so a failure
+    leaves the old data untouched. Returns the number of records moved.
+    Do not run while the API is serving writes.
+    """
+    if shard_count < 0:
+        raise ValueError("shard_count must not be negative")
+
+    shard_records: list[dict] = []
+    meta = _read_meta(shard_dir)
+    if meta is not None:
+        for i in range(meta["shards"]):
+            path = _shard_path(shard_dir, i)
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    shard_records.extend(json.load(f))
+    source_records: list[dict] = []
+    if os.path.exists(source):
+        with open(source, "r", encoding="utf-8") as f:
+            source_records = json.load(f)
+
+    if shard_records and source_records:
+        raise ValueError(
+            f"Both {source} ({len(source_records)} records) and {shard_dir} "
+            f"({len(shard_records)} records) hold data; merge or remove one before resharding"
+        )
+    records = shard_records or source_records
+
+    if shard_count == 0:
+        staging_file = source + ".tmp"
+        with open(staging_file, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2, ensure_ascii=False)
+        os.replace(staging_file, source)
+        shutil.rmtree(shard_dir, ignore_errors=True)
+        return len(records)
+
+    buckets: list[list[dict]] = [[] for _ in range(shard_count)]
+    for record in records:
+        buckets[shard_index(record["id"], shard_count)].append(record)
+
+    staging = shard_dir.rstrip(os.sep) + ".tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    for i, bucket in enumerate(buckets):
+        with open(_shard_path(staging, i), "w", encoding="utf-8") as f:
+            json.dump(bucket, f, indent=2, ensure_ascii=False)
+    with open(os.path.join(staging, META_FILE), "w", encoding="utf-8") as f:
+        json.dump({"shards": shard_count}, f)
+
+    if os.path.exists(shard_dir):
+        retired = shard_dir.rstrip(os.sep) + ".old"
+        shutil.rmtree(retired, ignore_errors=True)
+        os.rename(shard_dir, retired)
+        os.rename(staging, shard_dir)
+        shutil.rmtree(retired)
+    else:
+        os.rename(staging, shard_dir)
+    if source_records:
+        os.replace(source, source + ".pre-shard")
+    return len(records)
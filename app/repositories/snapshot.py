@@ -0,0 +1,209 @@
+"""
+Compact binary snapshot format for record collections.
+
+Layout (little-endian):
+    header      magic "ERSN", u16 format version, u16 field count, u32 record count
+    field names field count x (u16 length + UTF-8 name)
+    offsets     record count x u64 absolute offset of each record
+    id index    record count x u32 record number, sorted by id
+    records     per record, per field: 1-byte tag + u32 length + UTF-8 payload
+                tags: "s" string, "i" integer, "T"/"F" booleans (no payload),
+                "j" any other JSON value, "-" absent
+
+Snapshots are mmap'd read-only, so opening one costs only the header parse and
+records are decoded lazily when accessed. Pages are shared between processes
+through the OS page cache.
+"""
+import json
+import mmap
+import os
+import struct
+from typing import Any, Iterator, Optional
+
+from app.repositories.atomic import atomic_write, stat_key
+
+MAGIC = b"ERSN"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHI")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_VALUE = struct.Struct("<cI")
+
+_ABSENT = _VALUE.pack(b"-", 0)
+_TRUE = _VALUE.pack(b"T", 0)
+_FALSE = _VALUE.pack(b"F", 0)
+
+
+def _encode_value(value: Any) -> bytes:
+    if isinstance(value, str):
+        raw = value.encode("utf-8")
+        return _VALUE.pack(b"s", len(raw)) + raw
+    if value is True:
+        return _TRUE
+    if value is False:
+        return _FALSE
+    if type(value) is int:
+        raw = str(value).encode("ascii")
+        return _VALUE.pack(b"i", len(raw)) + raw
+    raw = json.dumps(value).encode("utf-8")
+    return _VALUE.pack(b"j", len(raw)) + raw
+
+
+def write_snapshot(path: str, records: list[dict]) -> None:
+    """Atomically write `records` to `path` (unique temp file + rename)."""
+    fields = list(dict.fromkeys(key for record in records for key in record))
+    if "id" not in fields:
+        fields.insert(0, "id")
+
+    names = b"".join(_U16.pack(len(n)) + n for n in (f.encode("utf-8") for f in fields))
+    encoded = [
+        b"".join(_encode_value(r[f]) if f in r else _ABSENT for f in fields) for r in records
+    ]
+    count = len(records)
+    data_start = _HEADER.size + len(names) + count * (_U64.size + _U32.size)
+
+    offsets = bytearray()
+    position = data_start
+    for blob in encoded:
+        offsets += _U64.pack(position)
+        position += len(blob)
+    order = sorted(range(count), key=lambda i: records[i].get("id", ""))
+    index = b"".join(_U32.pack(i) for i in order)
+
+    def write(f) -> None:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(fields), count))
+        f.write(names)
+        f.write(offsets)
+        f.write(index)
+        for blob in encoded:
+            f.write(blob)
+
+    atomic_write(path, write, binary=True)
+
+
+class Snapshot:
+    """Read-only, lazily decoded view over a snapshot file."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.stat_key = stat_key(stat)
+
+        magic, version, field_count, self._count = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} snapshot")
+        pos = _HEADER.size
+        fields = []
+        for _ in range(field_count):
+            (length,) = _U16.unpack_from(self._mm, pos)
+            pos += _U16.size
+            fields.append(self._mm[pos:pos + length].decode("utf-8"))
+            pos += length
+        self.fields = tuple(fields)
+        self._field_pos = {name: i for i, name in enumerate(fields)}
+        self._offsets_pos = pos
+        self._index_pos = pos + self._count * _U64.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    # ---- decoding ----
+    def _value_at(self, pos: int) -> tuple[Any, bool, int]:
+        """Decode the value at pos; returns (value, present, next_pos)."""
+        tag, length = _VALUE.unpack_from(self._mm, pos)
+        start = pos + _VALUE.size
+        end = start + length
+        if tag == b"s":
+            return self._mm[start:end].decode("utf-8"), True, end
+        if tag == b"T":
+            return True, True, end
+        if tag == b"F":
+            return False, True, end
+        if tag == b"i":
+            return int(self._mm[start:end]), True, end
+        if tag == b"j":
+            return json.loads(self._mm[start:end]), True, end
+        return None, False, end
+
+    def _record_pos(self, number: int) -> int:
+        return _U64.unpack_from(self._mm, self._offsets_pos + number * _U64.size)[0]
+
+    def record(self, number: int) -> dict:
+        # Hot path for get_all and rewrites, so the tag dispatch is inlined.
+        mm = self._mm
+        unpack, header = _VALUE.unpack_from, _VALUE.size
+        pos = self._record_pos(number)
+        data = {}
+        for name in self.fields:
+            tag, length = unpack(mm, pos)
+            start = pos + header
+            pos = start + length
+            if tag == b"s":
+                data[name] = mm[start:pos].decode("utf-8")
+            elif tag == b"T":
+                data[name] = True
+            elif tag == b"F":
+                data[name] = False
+            elif tag == b"i":
+                data[name] = int(mm[start:pos])
+            elif tag == b"j":
+                data[name] = json.loads(mm[start:pos])
+        return data
+
+    def value(self, number: int, field: str) -> Any:
+        """Decode a single field, skipping over the ones before it."""
+        target = self._field_pos.get(field)
+        if target is None:
+            return None
+        pos = self._record_pos(number)
+        for _ in range(target):
+            _, length = _VALUE.unpack_from(self._mm, pos)
+            pos += _VALUE.size + length
+        return self._value_at(pos)[0]
+
+    def records(self) -> Iterator[dict]:
+        for number in range(self._count):
+            yield self.record(number)
+
+    # ---- lookups ----
+    def find_id(self, entity_id: str) -> Optional[int]:
+        """Binary search the id index; returns the record number or None."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            number = _U32.unpack_from(self._mm, self._index_pos + mid * _U32.size)[0]
+            current = self.value(number, "id") or ""
+            if current < entity_id:
+                lo = mid + 1
+            elif current > entity_id:
+                hi = mid
+            else:
+                return number
+        return None
+
+    def find(self, field: str, value: Any) -> Optional[int]:
+        """Linear scan decoding only `field`; returns the first matching record number."""
+        if field == "id":
+            return self.find_id(value)
+        for number in range(self._count):
+            if self.value(number, field) == value:
+                return number
+        return None
+
+
+def json_to_snapshot(json_path: str, snapshot_path: str) -> int:
+    """Convert a JSON collection file to a snapshot; returns the record count."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        records = json.load(f)
+    write_snapshot(snapshot_path, records)
+    return len(records)
+
+
+def snapshot_to_json(snapshot_path: str, json_path: str) -> int:
+    """Convert a snapshot back to a JSON collection file; returns the record count."""
+    records = list(Snapshot(snapshot_path).records())
+    atomic_write(json_path, lambda f: json.dump(records, f, indent=2, ensure_ascii=False))
+    return len(records)
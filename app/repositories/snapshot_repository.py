@@ -0,0 +1,135 @@
+"""
+Snapshot-file backed repository.
+Reads come straight from a shared mmap of the binary snapshot and decode only the
+records they touch; writes rewrite the snapshot atomically, like JsonRepository.
+"""
+import os
+import threading
+from typing import Iterator, Optional, TypeVar, Type
+
+from app.repositories.atomic import file_lock, stat_key
+from app.repositories.base_repository import BaseRepository, VersionConflictError
+from app.repositories.snapshot import Snapshot, write_snapshot
+
+T = TypeVar("T")
+
+# Open snapshots are shared by every repository instance in the process.
+_open_snapshots: dict[str, Snapshot] = {}
+_open_snapshots_guard = threading.Lock()
+
+
+def open_snapshot(filepath: str) -> Snapshot:
+    """Return the mapped snapshot for filepath, remapping if the file was replaced."""
+    key = os.path.abspath(filepath)
+    current = stat_key(os.stat(key))
+    with _open_snapshots_guard:
+        snapshot = _open_snapshots.get(key)
+        if snapshot is None or snapshot.stat_key != current:
+            snapshot = _open_snapshots[key] = Snapshot(key)
+        return snapshot
+
+
+class SnapshotRepository(BaseRepository[T]):
+    """Thread-safe mmap'd binary snapshot store."""
+
+    def __init__(self, filepath: str, model_cls: Type[T]) -> None:
+        self._filepath = filepath
+        self._model_cls = model_cls
+        self._lock = file_lock(filepath)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with self._lock.exclusive():
+            if not os.path.exists(filepath):
+                source = os.path.splitext(filepath)[0] + ".json"
+                if os.path.exists(source):
+                    # starting empty would hide every record still in the JSON file
+                    raise RuntimeError(
+                        f"{filepath} does not exist but {source} does; "
+                        f"run `flask snapshot build` before switching STORAGE_FORMAT"
+                    )
+                write_snapshot(filepath, [])
+
+    # ---- internal helpers ----
+    def _snapshot(self) -> Snapshot:
+        return open_snapshot(self._filepath)
+
+    def _to_model(self, data: dict) -> T:
+        return self._model_cls.from_dict(data)  # type: ignore[attr-defined]
+
+    def _to_dict(self, entity: T) -> dict:
+        return entity.to_dict(include_hash=True) if hasattr(entity, "password_hash") else entity.to_dict()  # type: ignore[attr-defined]
+
+    # ---- public CRUD ----
+    def warm(self) -> None:
+        self._snapshot()
+
+    def get_all(self) -> list[T]:
+        return [self._to_model(d) for d in self._snapshot().records()]
+
+    def iter_all(self) -> Iterator[T]:
+        for data in self._snapshot().records():
+            yield self._to_model(data)
+
+    def get_by_id(self, entity_id: str) -> Optional[T]:
+        snapshot = self._snapshot()
+        number = snapshot.find_id(entity_id)
+        return self._to_model(snapshot.record(number)) if number is not None else None
+
+    def get_by_field(self, field: str, value: str) -> Optional[T]:
+        """Lookup by any field (e.g., username)."""
+        snapshot = self._snapshot()
+        number = snapshot.find(field, value)
+        return self._to_model(snapshot.record(number)) if number is not None else None
+
+    def create(self, entity: T) -> T:
+        with self._lock.exclusive():
+            data = list(self._snapshot().records())
+            data.append(self._to_dict(entity))
+            write_snapshot(self._filepath, data)
+        return entity
+
+    def bulk_create(self, entities: list[T]) -> None:
+        with self._lock.exclusive():
+            data = list(self._snapshot().records())
+            data.extend(self._to_dict(e) for e in entities)
+            write_snapshot(self._filepath, data)
+
+    def update(self, entity_id: str, entity: T) -> Optional[T]:
+        with self._lock.exclusive():
+            snapshot = self._snapshot()
+            number = snapshot.find_id(entity_id)
+            if number is None:
+                return None
+            data = list(snapshot.records())
+            data[number] = self._to_dict(entity)
+            write_snapshot(self._filepath, data)
+        return entity
+
+    def update_fields(
+        self, entity_id: str, changes: dict, expected_version: Optional[int] = None
+    ) -> Optional[T]:
+        with self._lock.exclusive():
+            snapshot = self._snapshot()
+            number = snapshot.find_id(entity_id)
+            if number is None:
+                return None
+            current = snapshot.value(number, "version") or 1
+            if expected_version is not None and expected_version != current:
+                raise VersionConflictError(current)
+            data = list(snapshot.records())
+            item = data[number]
+            item.update(changes)
+            item["id"] = entity_id
+            item["version"] = current + 1
+            write_snapshot(self._filepath, data)
+        return self._to_model(item)
+
+    def delete(self, entity_id: str) -> bool:
+        with self._lock.exclusive():
+            snapshot = self._snapshot()
+            number = snapshot.find_id(entity_id)
+            if number is None:
+                return False
+            data = list(snapshot.records())
+            del data[number]
+            write_snapshot(self._filepath, data)
+            return True
@@ -0,0 +1,96 @@
+"""
+Declarative payload schemas compiled into plain validator functions.
+A schema is described once as a mapping of field name -> FieldSpec and compiled
+at import time into straight-line Python source, so per-request validation is a
+single pass with no per-field dispatch or spec lookups.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+EMAIL_PATTERN = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}$"
+
+Validator = Callable[[Any], tuple[dict, dict[str, str]]]
+
+_MISSING = object()
+_TYPE_NAMES = {str: "string", bool: "boolean", int: "integer"}
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """Constraints for a single payload field."""
+    type: type = str
+    required: bool = True
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+    pattern: Optional[str] = None
+    pattern_message: str = "has an invalid format"
+    choices: Optional[tuple] = None
+    strip: bool = True
+
+
+def _field_source(index: int, name: str, spec: FieldSpec, required: bool, env: dict) -> list[str]:
+    """Emit the source lines that validate one field into `data` / `errors`."""
+    key = repr(name)
+    type_name = _TYPE_NAMES.get(spec.type, spec.type.__name__)
+    env[f"_t{index}"] = spec.type
+    lines = [f"    v = get({key}, _MISSING)", "    if v is _MISSING:"]
+    lines.append(f"        errors[{key}] = {name + ' is required'!r}" if required else "        pass")
+    # bool is a subclass of int, so compare exact types for scalars
+    lines.append(f"    elif type(v) is not _t{index}:")
+    lines.append(f"        errors[{key}] = {f'{name} must be a {type_name}'!r}")
+
+    checks: list[tuple[str, str]] = []
+    if spec.min_length is not None:
+        message = (f"{name} must not be empty" if spec.min_length == 1
+                   else f"{name} must be at least {spec.min_length} characters")
+        checks.append((f"len(v) < {spec.min_length}", message))
+    if spec.max_length is not None:
+        checks.append((f"len(v) > {spec.max_length}", f"{name} must be at most {spec.max_length} characters"))
+    if spec.pattern is not None:
+        env[f"_m{index}"] = re.compile(spec.pattern).match
+        checks.append((f"_m{index}(v) is None", f"{name} {spec.pattern_message}"))
+    if spec.choices is not None:
+        env[f"_c{index}"] = frozenset(spec.choices)
+        checks.append((f"v not in _c{index}", f"{name} must be one of: {', '.join(sorted(spec.choices))}"))
+
+    lines.append("    else:")
+    if spec.strip and spec.type is str:
+        lines.append("        v = v.strip()")
+    keyword = "if"
+    for condition, message in checks:
+        lines.append(f"        {keyword} {condition}:")
+        lines.append(f"            errors[{key}] = {message!r}")
+        keyword = "elif"
+    if checks:
+        lines.append("        else:")
+        lines.append(f"            data[{key}] = v")
+    else:
+        lines.append(f"        data[{key}] = v")
+    return lines
+
+
+def compile_schema(fields: dict[str, FieldSpec], partial: bool = False) -> Validator:
+    """
+    Compile a schema into a validator.
+    The validator returns (data, errors): data holds the cleaned known fields and
+    errors maps every failing field to its message. With partial=True, required
+    fields may be omitted (used for updates).
+    """
+    env: dict[str, Any] = {"_MISSING": _MISSING}
+    lines = [
+        "def validate(payload):",
+        "    if not isinstance(payload, dict):",
+        "        return {}, {'body': 'Request body must be a JSON object'}",
+        "    data = {}",
+        "    errors = {}",
+        "    get = payload.get",
+    ]
+    for index, (name, spec) in enumerate(fields.items()):
+        lines.extend(_field_source(index, name, spec, spec.required and not partial, env))
+    lines.append("    return data, errors")
+
+    exec(compile("\n".join(lines), "<schema>", "exec"), env)
+    return env["validate"]
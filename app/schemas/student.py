@@ -0,0 +1,17 @@
+"""
+Student payload schemas.
+"""
+from app.schemas.base import EMAIL_PATTERN, FieldSpec, compile_schema
+
+STUDENT_FIELDS = {
+    "first_name": FieldSpec(min_length=1, max_length=100),
+    "last_name": FieldSpec(min_length=1, max_length=100),
+    "email": FieldSpec(max_length=254, pattern=EMAIL_PATTERN, pattern_message="must be a valid email address"),
+    "course": FieldSpec(min_length=1, max_length=200),
+    "is_active": FieldSpec(type=bool, required=False),
+}
+
+validate_student_create = compile_schema(
+    {k: v for k, v in STUDENT_FIELDS.items() if k != "is_active"}
+)
+validate_student_update = compile_schema(STUDENT_FIELDS, partial=True)
@@ -0,0 +1,22 @@
+"""
+User (auth) payload schemas.
+"""
+from app.schemas.base import FieldSpec, compile_schema
+
+USERNAME_FIELD = FieldSpec(
+    min_length=3,
+    max_length=64,
+    pattern=r"^[A-Za-z0-9_.-]+$",
+    pattern_message="may only contain letters, digits, '.', '_' and '-'",
+)
+
+validate_register = compile_schema({
+    "username": USERNAME_FIELD,
+    "password": FieldSpec(min_length=8, max_length=128),
+    "role": FieldSpec(required=False, choices=("user", "admin")),
+})
+
+validate_login = compile_schema({
+    "username": FieldSpec(min_length=1, max_length=64),
+    "password": FieldSpec(min_length=1, max_length=128),
+})
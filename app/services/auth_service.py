@@ -1,17 +1,32 @@
 """
 Authentication service – business logic for login / register.
 """
+import asyncio
 import uuid
 from typing import Optional
 
 from flask_jwt_extended import create_access_token, create_refresh_token
 
 from app.models.user import User
-from app.repositories.json_repository import JsonRepository
+from app.repositories.async_base_repository import AsyncBaseRepository
+from app.repositories.base_repository import BaseRepository
+
+
+def _issue_tokens(user: User) -> dict:
+    access_token = create_access_token(
+        identity=user.id,
+        additional_claims={"role": user.role, "username": user.username},
+    )
+    refresh_token = create_refresh_token(identity=user.id)
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "user": user.to_dict(),
+    }
 
 
 class AuthService:
-    def __init__(self, repo: JsonRepository[User]) -> None:
+    def __init__(self, repo: BaseRepository[User]) -> None:
         self._repo = repo
 
     def register(self, username: str, password: str, role: str = "user") -> dict:
@@ -31,14 +46,30 @@ class AuthService:
         user = self._repo.get_by_field("username", username)
         if user is None or not user.verify_password(password):
             return None
+        return _issue_tokens(user)
+
+
+class AsyncAuthService:
+    """Awaitable AuthService; password hashing also runs off the event loop."""
+
+    def __init__(self, repo: AsyncBaseRepository[User]) -> None:
+        self._repo = repo
+
+    async def register(self, username: str, password: str, role: str = "user") -> dict:
+        if await self._repo.get_by_field("username", username):
+            raise ValueError("Username already exists")
 
-        access_token = create_access_token(
-            identity=user.id,
-            additional_claims={"role": user.role, "username": user.username},
+        user = User(
+            id=str(uuid.uuid4()),
+            username=username,
+            password_hash=await asyncio.to_thread(User.hash_password, password),
+            role=role,
         )
-        refresh_token = create_refresh_token(identity=user.id)
-        return {
-            "access_token": access_token,
-            "refresh_token": refresh_token,
-            "user": user.to_dict(),
-        }
+        await self._repo.create(user)
+        return user.to_dict()
+
+    async def login(self, username: str, password: str) -> Optional[dict]:
+        user = await self._repo.get_by_field("username", username)
+        if user is None or not await asyncio.to_thread(user.verify_password, password):
+            return None
+        return _issue_tokens(user)
@@ -0,0 +1,266 @@
+"""
+Job service – background bulk import / export of students.
+Jobs run on a small thread pool and persist their progress through a repository,
+so any worker process can answer a progress poll. Uploads and results live as
+files under the jobs directory and are parsed and validated in fixed-size chunks.
+
+Memory is not bounded by the chunk size alone. Imports buffer accepted students
+and write them in flushes of up to `flush_rows`, since the JSON stores rewrite
+the whole collection on every write and a write per chunk would be quadratic.
+Imports also hold every existing and imported email in a set, for duplicate
+detection, which grows with the collection. A failed import keeps the rows it had
+already flushed and reports how many in `imported`.
+
+Each job records the host and pid whose pool runs it plus a heartbeat on every
+progress write. A queued or running job whose process is gone (or, from another
+host, whose heartbeat is stale) is marked failed when it is next polled or swept.
+Finished jobs and their files are purged after the retention period, on the next
+job submission.
+"""
+import csv
+import itertools
+import json
+import logging
+import os
+import shutil
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from app.models.job import Job
+from app.models.student import Student
+from app.repositories.base_repository import BaseRepository, VersionConflictError
+from app.schemas.student import validate_student_create
+from app.services.student_service import StudentService
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("ndjson", "csv")
+MAX_REPORTED_ERRORS = 20
+EXPORT_FIELDS = list(Student.__dataclass_fields__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_guard = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    # Created lazily so each forked worker builds its own pool threads.
+    global _executor
+    with _executor_guard:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bulk-job")
+        return _executor
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _parse_rows(path: str, fmt: str) -> Iterator[tuple[int, Optional[dict], Optional[str]]]:
+    """Yield (line number, payload, parse error) one row at a time."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row, None
+            return
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_no, json.loads(line), None
+            except json.JSONDecodeError as exc:
+                yield line_no, None, f"Invalid JSON: {exc.msg}"
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobService:
+    def __init__(
+        self, repo: BaseRepository[Job], jobs_dir: str, chunk_size: int, max_workers: int, flush_rows: int,
+        stale_seconds: int, retention_seconds: int,
+    ) -> None:
+        self._repo = repo
+        self._jobs_dir = jobs_dir
+        self._chunk_size = chunk_size
+        self._flush_rows = flush_rows
+        self._max_workers = max_workers
+        self._stale_after = timedelta(seconds=stale_seconds)
+        self._retain_for = timedelta(seconds=retention_seconds)
+        os.makedirs(jobs_dir, exist_ok=True)
+
+    # ---- queries ----
+    def get_job(self, job_id: str, owner: str) -> Optional[dict]:
+        job = self._repo.get_by_id(job_id)
+        if job is None or job.owner != owner:
+            return None
+        return self._reap(job).to_dict()
+
+    def result_path(self, job: dict) -> Optional[str]:
+        if job["status"] != "succeeded" or not job["result_file"]:
+            return None
+        return os.path.join(self._jobs_dir, job["result_file"])
+
+    # ---- housekeeping ----
+    def _orphaned(self, job: Job) -> bool:
+        if job.status not in ("queued", "running"):
+            return False
+        if job.host == socket.gethostname():
+            return job.pid is None or not _pid_alive(job.pid)
+        # another host's pid cannot be checked; a queued job has no heartbeat yet
+        if job.status != "running" or job.heartbeat_at is None:
+            return False
+        return _now() - datetime.fromisoformat(job.heartbeat_at) > self._stale_after
+
+    def _reap(self, job: Job) -> Job:
+        """Mark job failed if the process running it is gone; returns the current job."""
+        if not self._orphaned(job):
+            return job
+        message = "Job was abandoned: the process running it exited"
+        if job.imported:
+            message += f"; {job.imported} rows were already stored"
+        try:
+            reaped = self._repo.update_fields(job.id, {
+                "status": "failed", "message": message, "finished_at": _now().isoformat(),
+            }, expected_version=job.version)
+        except VersionConflictError:
+            # the job wrote progress meanwhile, so it is not orphaned
+            reaped = self._repo.get_by_id(job.id)
+        return reaped or job
+
+    def purge_expired(self) -> int:
+        """Fail orphaned jobs and delete finished ones past retention; returns the count deleted."""
+        cutoff = _now() - self._retain_for
+        purged = 0
+        for job in self._repo.get_all():
+            job = self._reap(job)
+            if job.finished_at is None or datetime.fromisoformat(job.finished_at) > cutoff:
+                continue
+            for name in (f"{job.id}.upload", f"{job.id}.errors.ndjson", f"{job.id}.{job.format}"):
+                try:
+                    os.remove(os.path.join(self._jobs_dir, name))
+                except FileNotFoundError:
+                    pass
+            if self._repo.delete(job.id):
+                purged += 1
+        return purged
+
+    # ---- submission ----
+    def start_import(self, owner: str, fmt: str, source: BinaryIO, students: StudentService) -> dict:
+        """Spool the upload to disk (streamed) and queue the import."""
+        job = self._new_job("import", fmt, owner)
+        self.purge_expired()
+        upload_path = os.path.join(self._jobs_dir, f"{job.id}.upload")
+        with open(upload_path, "wb") as f:
+            shutil.copyfileobj(source, f, 64 * 1024)
+        self._repo.create(job)
+        _get_executor(self._max_workers).submit(self._run_import, job.id, upload_path, fmt, students)
+        return job.to_dict()
+
+    def start_export(self, owner: str, fmt: str, students: StudentService) -> dict:
+        job = self._new_job("export", fmt, owner)
+        self.purge_expired()
+        self._repo.create(job)
+        _get_executor(self._max_workers).submit(self._run_export, job.id, fmt, students)
+        return job.to_dict()
+
+    # ---- workers ----
+    def _new_job(self, kind: str, fmt: str, owner: str) -> Job:
+        if fmt not in FORMATS:
+            raise ValueError(f"format must be one of: {', '.join(FORMATS)}")
+        # the pool that runs the job belongs to this process
+        return Job(id=str(uuid.uuid4()), kind=kind, format=fmt, owner=owner,
+                   host=socket.gethostname(), pid=os.getpid())
+
+    def _progress(self, job_id: str, **changes) -> None:
+        self._repo.update_fields(job_id, {**changes, "heartbeat_at": _now().isoformat()})
+
+    def _finish(self, job_id: str, **changes) -> None:
+        self._progress(job_id, finished_at=_now().isoformat(), **changes)
+
+    def _run_import(self, job_id: str, upload_path: str, fmt: str, students: StudentService) -> None:
+        report_file = f"{job_id}.errors.ndjson"
+        processed = failed = imported = 0
+        errors: list[dict] = []
+        pending: list[Student] = []
+        try:
+            self._progress(job_id, status="running")
+            known_emails = students.known_emails()
+            with open(os.path.join(self._jobs_dir, report_file), "w", encoding="utf-8") as report:
+                for chunk in _chunks(_parse_rows(upload_path, fmt), self._chunk_size):
+                    rows, lines, rejected = [], [], []
+                    for line_no, payload, parse_error in chunk:
+                        if parse_error is not None:
+                            rejected.append({"line": line_no, "errors": {"body": parse_error}})
+                            continue
+                        data, field_errors = validate_student_create(payload)
+                        if field_errors:
+                            rejected.append({"line": line_no, "errors": field_errors})
+                        else:
+                            rows.append(data)
+                            lines.append(line_no)
+                    accepted, duplicates = students.prepare_import(rows, known_emails)
+                    for index, reason in duplicates:
+                        rejected.append({"line": lines[index], "errors": {"email": reason}})
+                    pending.extend(accepted)
+                    if len(pending) >= self._flush_rows:
+                        students.save_students(pending)
+                        imported += len(pending)
+                        pending = []
+
+                    for entry in rejected:
+                        report.write(json.dumps(entry) + "\n")
+                    processed += len(chunk)
+                    failed += len(rejected)
+                    errors = (errors + rejected)[:MAX_REPORTED_ERRORS]
+                    self._progress(job_id, processed=processed, failed=failed, errors=errors,
+                                   imported=imported)
+            students.save_students(pending)
+            imported += len(pending)
+            self._finish(job_id, status="succeeded", result_file=report_file, imported=imported)
+        except Exception as exc:
+            logger.exception("Import job %s failed", job_id)
+            message = str(exc)
+            if imported:
+                message += f"; {imported} rows were already stored"
+            self._finish(job_id, status="failed", message=message, imported=imported)
+        finally:
+            os.remove(upload_path)
+
+    def _run_export(self, job_id: str, fmt: str, students: StudentService) -> None:
+        result_file = f"{job_id}.{fmt}"
+        processed = 0
+        try:
+            self._progress(job_id, status="running")
+            with open(os.path.join(self._jobs_dir, result_file), "w", encoding="utf-8", newline="") as out:
+                writer = csv.DictWriter(out, fieldnames=EXPORT_FIELDS) if fmt == "csv" else None
+                if writer is not None:
+                    writer.writeheader()
+                for chunk in _chunks(students.iter_students(), self._chunk_size):
+                    if writer is not None:
+                        writer.writerows(chunk)
+                    else:
+                        out.writelines(json.dumps(s, ensure_ascii=False) + "\n" for s in chunk)
+                    processed += len(chunk)
+                    self._progress(job_id, processed=processed)
+            self._finish(job_id, status="succeeded", result_file=result_file)
+        except Exception as exc:
+            logger.exception("Export job %s failed", job_id)
+            self._finish(job_id, status="failed", message=str(exc))
@@ -2,14 +2,25 @@
 Student service – business logic for student CRUD.
 """
 import uuid
-from typing import Optional
+from typing import Iterator, Optional
 
 from app.models.student import Student
-from app.repositories.json_repository import JsonRepository
+from app.repositories.async_base_repository import AsyncBaseRepository
+from app.repositories.base_repository import BaseRepository
+
+
+def _new_student(data: dict) -> Student:
+    return Student(
+        id=str(uuid.uuid4()),
+        first_name=data["first_name"],
+        last_name=data["last_name"],
+        email=data["email"],
+        course=data["course"],
+    )
 
 
 class StudentService:
-    def __init__(self, repo: JsonRepository[Student]) -> None:
+    def __init__(self, repo: BaseRepository[Student]) -> None:
         self._repo = repo
 
     def list_students(self) -> list[dict]:
@@ -24,32 +35,87 @@ class StudentService:
         if self._repo.get_by_field("email", data.get("email", "")):
             raise ValueError("A student with this email already exists")
 
-        student = Student(
-            id=str(uuid.uuid4()),
-            first_name=data["first_name"],
-            last_name=data["last_name"],
-            email=data["email"],
-            course=data["course"],
-        )
+        student = _new_student(data)
         self._repo.create(student)
         return student.to_dict()
 
-    def update_student(self, student_id: str, data: dict) -> Optional[dict]:
-        existing = self._repo.get_by_id(student_id)
-        if existing is None:
-            return None
-
-        updated = Student(
-            id=student_id,
-            first_name=data.get("first_name", existing.first_name),
-            last_name=data.get("last_name", existing.last_name),
-            email=data.get("email", existing.email),
-            course=data.get("course", existing.course),
-            enrollment_date=existing.enrollment_date,
-            is_active=data.get("is_active", existing.is_active),
-        )
-        self._repo.update(student_id, updated)
-        return updated.to_dict()
+    def update_student(
+        self, student_id: str, data: dict, expected_version: Optional[int] = None
+    ) -> Optional[dict]:
+        return self.patch_student(student_id, data, expected_version)
+
+    def patch_student(
+        self, student_id: str, changes: dict, expected_version: Optional[int] = None
+    ) -> Optional[dict]:
+        """Apply a merge patch; raises VersionConflictError on a stale version."""
+        updated = self._repo.update_fields(student_id, changes, expected_version)
+        return updated.to_dict() if updated else None
+
+    def iter_students(self) -> Iterator[dict]:
+        for student in self._repo.iter_all():
+            yield student.to_dict()
+
+    def known_emails(self) -> set[str]:
+        return {s.email for s in self._repo.iter_all()}
+
+    def prepare_import(
+        self, rows: list[dict], known_emails: set[str]
+    ) -> tuple[list[Student], list[tuple[int, str]]]:
+        """
+        Build students from validated rows without writing them.
+        known_emails is updated in place so duplicates are caught across chunks;
+        returns the new students and (row index, reason) for every rejected row.
+        """
+        students, rejected = [], []
+        for index, data in enumerate(rows):
+            if data["email"] in known_emails:
+                rejected.append((index, "A student with this email already exists"))
+                continue
+            known_emails.add(data["email"])
+            students.append(_new_student(data))
+        return students, rejected
+
+    def save_students(self, students: list[Student]) -> None:
+        """Persist prepared students in one repository write."""
+        if students:
+            self._repo.bulk_create(students)
 
     def delete_student(self, student_id: str) -> bool:
         return self._repo.delete(student_id)
+
+
+class AsyncStudentService:
+    """Awaitable StudentService for async views."""
+
+    def __init__(self, repo: AsyncBaseRepository[Student]) -> None:
+        self._repo = repo
+
+    async def list_students(self) -> list[dict]:
+        return [s.to_dict() for s in await self._repo.get_all()]
+
+    async def get_student(self, student_id: str) -> Optional[dict]:
+        student = await self._repo.get_by_id(student_id)
+        return student.to_dict() if student else None
+
+    async def create_student(self, data: dict) -> dict:
+        if await self._repo.get_by_field("email", data.get("email", "")):
+            raise ValueError("A student with this email already exists")
+
+        student = _new_student(data)
+        await self._repo.create(student)
+        return student.to_dict()
+
+    async def update_student(
+        self, student_id: str, data: dict, expected_version: Optional[int] = None
+    ) -> Optional[dict]:
+        return await self.patch_student(student_id, data, expected_version)
+
+    async def patch_student(
+        self, student_id: str, changes: dict, expected_version: Optional[int] = None
+    ) -> Optional[dict]:
+        """Apply a merge patch; raises VersionConflictError on a stale version."""
+        updated = await self._repo.update_fields(student_id, changes, expected_version)
+        return updated.to_dict() if updated else None
+
+    async def delete_student(self, student_id: str) -> bool:
+        return await self._repo.delete(student_id)
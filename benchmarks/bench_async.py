@@ -0,0 +1,88 @@
+"""
+Concurrent-request throughput: sync student views vs ASYNC_VIEWS=True.
+Run from the project root: python -m benchmarks.bench_async [clients] [seconds]
+
+Each variant is served by a threaded Werkzeug server over its own copy of the
+same seeded data directory, then hammered by the same number of HTTP client
+threads with a mix of GET /students/<id> and GET /students.
+"""
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+import uuid
+
+from flask_jwt_extended import create_access_token
+from werkzeug.serving import make_server
+
+from app import create_app
+from app.config import ProductionConfig, config_by_name
+
+SEED_STUDENTS = 2_000
+
+
+def _seed(data_dir: str) -> list[str]:
+    ids = [str(uuid.uuid4()) for _ in range(SEED_STUDENTS)]
+    students = [
+        {"id": sid, "first_name": "F", "last_name": "L", "email": f"s{i}@example.com",
+         "course": "CS", "enrollment_date": "2026-01-01T00:00:00+00:00", "is_active": True, "version": 1}
+        for i, sid in enumerate(ids)
+    ]
+    with open(os.path.join(data_dir, "students.json"), "w", encoding="utf-8") as f:
+        json.dump(students, f)
+    return ids
+
+
+def _run(name: str, async_views: bool, seed_dir: str, ids: list[str], clients: int, seconds: float) -> None:
+    data_dir = tempfile.mkdtemp()
+    shutil.copytree(seed_dir, data_dir, dirs_exist_ok=True)
+    config_by_name[name] = type(name, (ProductionConfig,), {"DATA_DIR": data_dir, "ASYNC_VIEWS": async_views})
+    app = create_app(name)
+    with app.app_context():
+        token = create_access_token(identity="bench")
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}/api/v1/students"
+
+    counts = [0] * clients
+    deadline = time.perf_counter() + seconds
+
+    def client(slot: int) -> None:
+        n = 0
+        while time.perf_counter() < deadline:
+            url = base if n % 20 == 0 else f"{base}/{ids[(slot * 7919 + n) % len(ids)]}"
+            req = urllib.request.Request(url, headers={"Authorization": f"Bearer {token}"})
+            with urllib.request.urlopen(req) as resp:
+                resp.read()
+            n += 1
+        counts[slot] = n
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    server.shutdown()
+    shutil.rmtree(data_dir, ignore_errors=True)
+    print(f"  {name:<6} {sum(counts) / seconds:8.0f} req/s  ({clients} clients, {seconds:.0f}s)")
+
+
+def main(clients: int = 16, seconds: float = 5.0) -> None:
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    seed_dir = tempfile.mkdtemp()
+    try:
+        ids = _seed(seed_dir)
+        _run("sync", False, seed_dir, ids, clients, seconds)
+        _run("async", True, seed_dir, ids, clients, seconds)
+    finally:
+        shutil.rmtree(seed_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
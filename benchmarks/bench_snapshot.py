@@ -0,0 +1,63 @@
+"""
+Cold-start benchmark: parsing students.json vs opening a binary snapshot.
+Run from the project root: python -m benchmarks.bench_snapshot [records]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+from app.repositories.snapshot import Snapshot, write_snapshot
+
+
+def _records(count: int) -> list[dict]:
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "email": f"student{i}@example.com",
+            "course": "Computer Science",
+            "enrollment_date": "2026-02-13T15:08:16.248742+00:00",
+            "is_active": True,
+            "version": 1,
+        }
+        for i in range(count)
+    ]
+
+
+def _timed(label: str, fn) -> None:
+    start = time.perf_counter()
+    fn()
+    print(f"  {label:<34} {(time.perf_counter() - start) * 1e3:9.2f} ms")
+
+
+def main(count: int = 200_000) -> None:
+    records = _records(count)
+    probe = records[count // 2]["id"]
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "students.json")
+        snap_path = os.path.join(tmp, "students.snap")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2)
+        write_snapshot(snap_path, records)
+        print(f"{count} records: json {os.path.getsize(json_path) >> 10} KiB, "
+              f"snapshot {os.path.getsize(snap_path) >> 10} KiB")
+
+        def json_lookup():
+            with open(json_path, "r", encoding="utf-8") as f:
+                next(r for r in json.load(f) if r["id"] == probe)
+
+        def snapshot_lookup():
+            snapshot = Snapshot(snap_path)
+            snapshot.record(snapshot.find_id(probe))
+
+        _timed("json: load + get_by_id", json_lookup)
+        _timed("snapshot: open + get_by_id", snapshot_lookup)
+        _timed("snapshot: open + decode all", lambda: list(Snapshot(snap_path).records()))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
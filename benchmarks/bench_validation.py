@@ -0,0 +1,49 @@
+"""
+Micro-benchmark for student payload validation.
+Run from the project root: python -m benchmarks.bench_validation
+
+Compares, per request body:
+  * legacy   – the old ad-hoc check in create_student (non-empty strings only)
+  * compiled – app.schemas validators (types, lengths, email format)
+
+The compiled validator is NOT cheaper than the legacy check: it does strictly
+more work (type and length checks plus an email regex) and measures at roughly
+2.5x the legacy cost on a valid body (about 1.0 us vs 2.6 us, so an extra
+~1.5 us per request). The legacy check cannot handle invalid bodies at all
+(non-string values raise).
+"""
+import timeit
+
+from app.schemas.student import validate_student_create
+
+VALID = {
+    "first_name": "Alice",
+    "last_name": "Smith",
+    "email": "alice@example.com",
+    "course": "Computer Science",
+}
+INVALID = {"first_name": "", "last_name": 42, "email": "not-an-email"}
+
+
+def legacy(body: dict) -> list[str]:
+    required_fields = ("first_name", "last_name", "email", "course")
+    return [f for f in required_fields if not body.get(f, "").strip()]
+
+
+def _bench(label: str, fn, body: dict, number: int) -> float:
+    per_call = min(timeit.repeat(lambda: fn(body), number=number, repeat=5)) / number * 1e9
+    print(f"  {label:<10} {per_call:8.0f} ns/call")
+    return per_call
+
+
+def main(number: int = 200_000) -> None:
+    print("valid payload")
+    old = _bench("legacy", legacy, VALID, number)
+    new = _bench("compiled", validate_student_create, VALID, number)
+    print(f"  compiled / legacy = {new / old:.1f}x (+{(new - old) / 1000:.2f} us per request)")
+    print("invalid payload (legacy raises on non-string values, so it is skipped)")
+    _bench("compiled", validate_student_create, INVALID, number)
+
+
+if __name__ == "__main__":
+    main()
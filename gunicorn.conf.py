@@ -0,0 +1,37 @@
+"""
+Gunicorn configuration (loaded automatically from the working directory).
+
+The app is preloaded in the master, so wsgi.py warms the repositories once.
+Workers then inherit the parsed collections through fork. The garbage collector
+is paused while the app loads, and live objects are frozen before forking.
+That keeps GC passes in the workers from writing to the shared pages and
+breaking copy-on-write.
+"""
+import gc
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 4))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
+preload_app = True
+
+# No collections while the preloaded app builds its long-lived objects.
+gc.disable()
+
+
+def when_ready(server):
+    # The preloaded app is built: move it out of GC tracking, then resume GC.
+    gc.freeze()
+    gc.enable()
+
+
+def pre_fork(server, worker):
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # Reload only the collections written since the master warmed them.
+    from app.repositories.json_repository import refresh_collections
+    refreshed = refresh_collections()
+    if refreshed:
+        server.log.info("Worker %s refreshed %d collection(s)", worker.pid, len(refreshed))
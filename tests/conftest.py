@@ -3,6 +3,7 @@ Shared test fixtures.
 """
 import os
 import shutil
+import time
 import pytest
 from app import create_app
 
@@ -40,3 +41,27 @@ def auth_headers(client):
     })
     token = resp.get_json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture()
+def sample_student():
+    """Valid student payload; override "email" to create several."""
+    return {
+        "first_name": "Alice",
+        "last_name": "Smith",
+        "email": "alice@example.com",
+        "course": "Computer Science",
+    }
+
+
+@pytest.fixture()
+def wait_for_job(client, auth_headers):
+    """Poll a job's Location until it finishes (or times out) and return it."""
+    def wait(location, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while True:
+            job = client.get(location, headers=auth_headers).get_json()
+            if job["status"] in ("succeeded", "failed") or time.monotonic() > deadline:
+                return job
+            time.sleep(0.02)
+    return wait
@@ -50,3 +50,13 @@ def test_login_invalid_password(client):
         "password": "WrongPass",
     })
     assert resp.status_code == 401
+
+
+def test_register_rejects_invalid_role(client):
+    resp = client.post("/api/v1/auth/register", json={
+        "username": "roleuser",
+        "password": "Str0ngP@ss",
+        "role": "superuser",
+    })
+    assert resp.status_code == 400
+    assert "role" in resp.get_json()["fields"]
@@ -0,0 +1,152 @@
+"""
+Tests for bulk import / export jobs and /api/v1/jobs.
+"""
+import csv
+import io
+import json
+import multiprocessing
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+
+from flask_jwt_extended import decode_token
+
+from app.models.job import Job
+from app.repositories.factory import build_repository
+from app.services.student_service import StudentService
+
+
+def _rows(prefix, count):
+    return [{"first_name": "F", "last_name": "L", "email": f"{prefix}{i}@example.com", "course": "CS"}
+            for i in range(count)]
+
+
+def test_ndjson_import_in_chunks(app, client, auth_headers, wait_for_job):
+    app.config["BULK_CHUNK_SIZE"] = 3
+    app.config["BULK_FLUSH_ROWS"] = 4
+    rows = _rows("nd", 7) + [{"first_name": "", "email": "bad"}, _rows("nd", 1)[0]]
+    body = "\n".join(json.dumps(r) for r in rows) + "\n{not json\n"
+
+    resp = client.post("/api/v1/students/import", data=body,
+                       content_type="application/x-ndjson", headers=auth_headers)
+    assert resp.status_code == 202
+    job = wait_for_job(resp.headers["Location"])
+
+    assert job["status"] == "succeeded"
+    assert job["processed"] == 10
+    assert job["failed"] == 3
+    assert {e["line"] for e in job["errors"]} == {8, 9, 10}
+
+    report = client.get(f"{resp.headers['Location']}/result", headers=auth_headers)
+    assert report.status_code == 200
+    assert len(report.get_data(as_text=True).splitlines()) == 3
+
+    # rows from the mid-job flush and the final flush are all stored
+    listed = client.get("/api/v1/students", headers=auth_headers).get_json()["students"]
+    emails = {s["email"] for s in listed}
+    assert {f"nd{i}@example.com" for i in range(7)} <= emails
+
+
+def test_csv_upload_then_export(client, auth_headers, wait_for_job):
+    upload = io.StringIO()
+    writer = csv.DictWriter(upload, fieldnames=["first_name", "last_name", "email", "course"])
+    writer.writeheader()
+    writer.writerows(_rows("csv", 4))
+    resp = client.post("/api/v1/students/import", headers=auth_headers, data={
+        "file": (io.BytesIO(upload.getvalue().encode()), "students.csv"),
+    })
+    assert resp.status_code == 202
+    assert wait_for_job(resp.headers["Location"])["failed"] == 0
+
+    resp = client.post("/api/v1/students/export?format=csv", headers=auth_headers)
+    assert resp.status_code == 202
+    job = wait_for_job(resp.headers["Location"])
+    assert job["status"] == "succeeded"
+
+    result = client.get(f"{resp.headers['Location']}/result", headers=auth_headers)
+    assert result.mimetype == "text/csv"
+    emails = {r["email"] for r in csv.DictReader(io.StringIO(result.get_data(as_text=True)))}
+    assert {f"csv{i}@example.com" for i in range(4)} <= emails
+
+
+def test_unknown_format_and_missing_job(client, auth_headers):
+    resp = client.post("/api/v1/students/export?format=xml", headers=auth_headers)
+    assert resp.status_code == 400
+    resp = client.get("/api/v1/jobs/does-not-exist", headers=auth_headers)
+    assert resp.status_code == 404
+
+
+def _dead_pid():
+    proc = multiprocessing.get_context("fork").Process(target=int)
+    proc.start()
+    proc.join()
+    return proc.pid
+
+
+def _owner(app, headers):
+    with app.app_context():
+        return decode_token(headers["Authorization"].split()[1])["sub"]
+
+
+def test_orphaned_jobs_are_failed_on_poll(app, client, auth_headers):
+    owner = _owner(app, auth_headers)
+    stale = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+    repo = build_repository(app.config, "jobs", Job)
+    repo.create(Job(id="orphan-local", kind="export", format="csv", owner=owner,
+                    status="running", host=socket.gethostname(), pid=_dead_pid()))
+    repo.create(Job(id="orphan-remote", kind="import", format="csv", owner=owner,
+                    status="running", host="elsewhere", pid=1, heartbeat_at=stale, imported=5))
+    repo.create(Job(id="alive", kind="export", format="csv", owner=owner,
+                    status="running", host=socket.gethostname(), pid=os.getpid()))
+
+    job = client.get("/api/v1/jobs/orphan-local", headers=auth_headers).get_json()
+    assert job["status"] == "failed"
+    assert job["finished_at"] is not None
+    job = client.get("/api/v1/jobs/orphan-remote", headers=auth_headers).get_json()
+    assert job["status"] == "failed"
+    assert "5 rows were already stored" in job["message"]
+    assert client.get("/api/v1/jobs/alive", headers=auth_headers).get_json()["status"] == "running"
+    repo.delete("alive")
+
+
+def test_finished_jobs_are_purged_after_retention(app, client, auth_headers, wait_for_job):
+    owner = _owner(app, auth_headers)
+    jobs_dir = os.path.join(app.config["DATA_DIR"], "jobs")
+    expired = (datetime.now(timezone.utc) - timedelta(seconds=app.config["JOB_RETENTION_SECONDS"] + 60))
+    repo = build_repository(app.config, "jobs", Job)
+    repo.create(Job(id="expired", kind="export", format="csv", owner=owner, status="succeeded",
+                    result_file="expired.csv", finished_at=expired.isoformat()))
+    os.makedirs(jobs_dir, exist_ok=True)
+    with open(os.path.join(jobs_dir, "expired.csv"), "w", encoding="utf-8") as f:
+        f.write("id\n")
+
+    resp = client.post("/api/v1/students/export", headers=auth_headers)
+    assert resp.status_code == 202
+    wait_for_job(resp.headers["Location"])
+
+    assert repo.get_by_id("expired") is None
+    assert not os.path.exists(os.path.join(jobs_dir, "expired.csv"))
+    assert client.get("/api/v1/jobs/expired", headers=auth_headers).status_code == 404
+
+
+def test_failed_import_reports_stored_rows(app, client, auth_headers, monkeypatch, wait_for_job):
+    app.config["BULK_CHUNK_SIZE"] = 2
+    app.config["BULK_FLUSH_ROWS"] = 2
+    real_save = StudentService.save_students
+    calls = []
+
+    def save_then_fail(self, students):
+        calls.append(len(students))
+        if len(calls) > 1:
+            raise OSError("disk full")
+        real_save(self, students)
+
+    monkeypatch.setattr(StudentService, "save_students", save_then_fail)
+    body = "\n".join(json.dumps(r) for r in _rows("partial", 5))
+    resp = client.post("/api/v1/students/import", data=body,
+                       content_type="application/x-ndjson", headers=auth_headers)
+    job = wait_for_job(resp.headers["Location"])
+
+    assert job["status"] == "failed"
+    assert job["imported"] == 2
+    assert job["message"] == "disk full; 2 rows were already stored"
@@ -0,0 +1,119 @@
+"""
+Tests for the JSON repository's shared, stat-validated collection cache.
+"""
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from app.models.student import Student
+from app.repositories.base_repository import VersionConflictError
+from app.repositories.json_repository import JsonRepository, refresh_collections
+
+
+def _student(sid: str, course: str = "CS") -> dict:
+    return Student(id=sid, first_name="A", last_name="B",
+                   email=f"{sid}@example.com", course=course).to_dict()
+
+
+def test_warm_cache_is_shared_and_tracks_external_writes(tmp_path):
+    path = tmp_path / "students.json"
+    path.write_text(json.dumps([_student("s1")]), encoding="utf-8")
+    repo = JsonRepository[Student](str(path), Student)
+    repo.warm()
+
+    # another process rewrites the file (new inode, as the repository itself does)
+    replacement = tmp_path / "replacement.json"
+    replacement.write_text(json.dumps([_student("s1", "Maths"), _student("s2")]), encoding="utf-8")
+    replacement.replace(path)
+
+    assert str(path) in refresh_collections()
+    assert refresh_collections() == []
+    other = JsonRepository[Student](str(path), Student)
+    assert other.get_by_id("s1").course == "Maths"
+    assert len(other.get_all()) == 2
+
+
+def test_failed_conditional_update_leaves_cache_untouched(tmp_path):
+    path = tmp_path / "students.json"
+    repo = JsonRepository[Student](str(path), Student)
+    repo.create(Student.from_dict(_student("s1")))
+    repo.update_fields("s1", {"course": "Maths"})
+    with pytest.raises(VersionConflictError):
+        repo.update_fields("s1", {"course": "Art"}, expected_version=1)
+    assert repo.get_by_id("s1").course == "Maths"
+    assert json.loads(path.read_text(encoding="utf-8"))[0]["version"] == 2
+
+
+def test_concurrent_replace_after_write_is_not_masked(tmp_path, monkeypatch):
+    path = tmp_path / "students.json"
+    repo = JsonRepository[Student](str(path), Student)
+    real_replace = os.replace
+
+    def replace_then_lose_race(src, dst):
+        real_replace(src, dst)
+        # another worker replaces the file right after our rename
+        other = tmp_path / "other.json"
+        other.write_text(json.dumps([_student("other")]), encoding="utf-8")
+        real_replace(other, dst)
+
+    monkeypatch.setattr(os, "replace", replace_then_lose_race)
+    repo.create(Student.from_dict(_student("mine")))
+    monkeypatch.setattr(os, "replace", real_replace)
+
+    assert [s.id for s in repo.get_all()] == ["other"]
+
+
+def _create_many(path: str, prefix: str) -> None:
+    repo = JsonRepository[Student](path, Student)
+    for n in range(50):
+        repo.create(Student.from_dict(_student(f"{prefix}-{n}")))
+
+
+def test_multi_process_writes_never_tear_the_file(tmp_path):
+    path = str(tmp_path / "students.json")
+    JsonRepository[Student](path, Student)
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_create_many, args=(path, f"p{i}")) for i in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+
+    assert [p.exitcode for p in procs] == [0, 0, 0, 0]
+    with open(path, encoding="utf-8") as f:
+        records = json.load(f)
+    # writers hold the cross-process flock, so no create is lost either
+    assert len(records) == 200
+    assert len({r["id"] for r in records}) == 200
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+
+def _conditional_updates(path: str, results) -> None:
+    repo = JsonRepository[Student](path, Student)
+    succeeded = 0
+    for _ in range(50):
+        current = repo.get_by_id("s1").version
+        try:
+            repo.update_fields("s1", {"course": str(current)}, expected_version=current)
+            succeeded += 1
+        except VersionConflictError:
+            pass
+    results.put(succeeded)
+
+
+def test_conditional_updates_are_not_lost_across_processes(tmp_path):
+    path = str(tmp_path / "students.json")
+    JsonRepository[Student](path, Student).create(Student.from_dict(_student("s1")))
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_conditional_updates, args=(path, results)) for _ in range(4)]
+    for p in procs:
+        p.start()
+    succeeded = sum(results.get(timeout=30) for _ in procs)
+    for p in procs:
+        p.join()
+
+    # every update that passed its version check is reflected in the version
+    assert JsonRepository[Student](path, Student).get_by_id("s1").version == 1 + succeeded
@@ -0,0 +1,30 @@
+"""
+Tests for the compiled payload schemas.
+"""
+from app.schemas.student import validate_student_create, validate_student_update
+
+
+def test_create_strips_and_drops_unknown_fields():
+    data, errors = validate_student_create({
+        "first_name": " Alice ", "last_name": "Smith",
+        "email": "alice@example.com", "course": "CS", "id": "forged",
+    })
+    assert errors == {}
+    assert data == {"first_name": "Alice", "last_name": "Smith",
+                    "email": "alice@example.com", "course": "CS"}
+
+
+def test_update_is_partial():
+    data, errors = validate_student_update({"is_active": False})
+    assert errors == {}
+    assert data == {"is_active": False}
+
+
+def test_non_object_body():
+    _, errors = validate_student_update(["not", "a", "dict"])
+    assert "body" in errors
+
+
+def test_length_limits():
+    _, errors = validate_student_update({"first_name": "x" * 101})
+    assert errors == {"first_name": "first_name must be at most 100 characters"}
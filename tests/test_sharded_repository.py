@@ -0,0 +1,110 @@
+"""
+Tests for the hash-partitioned student repository.
+"""
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from app import create_app
+from app.config import TestingConfig
+from app.models.student import Student
+from app.repositories.sharded_repository import ShardedJsonRepository, reshard, shard_index
+
+
+def _student(n: int) -> Student:
+    return Student(id=f"id-{n}", first_name="A", last_name="B",
+                   email=f"s{n}@example.com", course="CS")
+
+
+def test_writes_touch_only_their_shard(tmp_path):
+    reshard(str(tmp_path / "students.json"), str(tmp_path / "shards"), 4)
+    repo = ShardedJsonRepository[Student](str(tmp_path / "shards"), Student, 4)
+    for n in range(20):
+        repo.create(_student(n))
+
+    for i in range(4):
+        with open(tmp_path / "shards" / f"shard_{i:03d}.json", encoding="utf-8") as f:
+            ids = [r["id"] for r in json.load(f)]
+        assert all(shard_index(sid, 4) == i for sid in ids)
+
+    assert len(repo.get_all()) == 20
+    assert repo.get_by_id("id-7").email == "s7@example.com"
+    assert repo.get_by_field("email", "s13@example.com").id == "id-13"
+    assert repo.update_fields("id-3", {"course": "Maths"}).course == "Maths"
+    assert repo.delete("id-3")
+    assert repo.get_by_id("id-3") is None
+
+
+def _create_many(shard_dir: str, offset: int) -> None:
+    repo = ShardedJsonRepository[Student](shard_dir, Student, 4)
+    for n in range(offset, offset + 50):
+        repo.create(_student(n))
+
+
+def test_multi_process_creates_are_not_lost(tmp_path):
+    shard_dir = str(tmp_path / "shards")
+    reshard(str(tmp_path / "students.json"), shard_dir, 4)
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_create_many, args=(shard_dir, i * 50)) for i in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+
+    assert [p.exitcode for p in procs] == [0, 0, 0, 0]
+    counts = []
+    for i in range(4):
+        with open(os.path.join(shard_dir, f"shard_{i:03d}.json"), encoding="utf-8") as f:
+            counts.append(len(json.load(f)))
+    assert sum(counts) == 200
+    assert len(ShardedJsonRepository[Student](shard_dir, Student, 4).get_all()) == 200
+
+
+def test_missing_or_mismatched_layout_is_rejected(tmp_path):
+    with pytest.raises(RuntimeError):
+        ShardedJsonRepository[Student](str(tmp_path / "shards"), Student, 4)
+    assert not os.path.exists(tmp_path / "shards")
+
+    reshard(str(tmp_path / "students.json"), str(tmp_path / "shards"), 4)
+    with pytest.raises(RuntimeError):
+        ShardedJsonRepository[Student](str(tmp_path / "shards"), Student, 2)
+
+
+def test_reshard_refuses_two_sources(tmp_path):
+    source = tmp_path / "students.json"
+    shard_dir = str(tmp_path / "shards")
+    source.write_text(json.dumps([_student(n).to_dict() for n in range(3)]), encoding="utf-8")
+    reshard(str(source), shard_dir, 2)
+
+    source.write_text(json.dumps([_student(9).to_dict()]), encoding="utf-8")
+    with pytest.raises(ValueError):
+        reshard(str(source), shard_dir, 4)
+    assert len(ShardedJsonRepository[Student](shard_dir, Student, 2).get_all()) == 3
+
+
+def test_reshard_round_trip(tmp_path):
+    source = tmp_path / "students.json"
+    source.write_text(json.dumps([_student(n).to_dict() for n in range(10)]), encoding="utf-8")
+    shard_dir = str(tmp_path / "shards")
+
+    assert reshard(str(source), shard_dir, 3) == 10
+    assert not source.exists()
+    assert (tmp_path / "students.json.pre-shard").exists()
+    assert len(ShardedJsonRepository[Student](shard_dir, Student, 3).get_all()) == 10
+
+    assert reshard(str(source), shard_dir, 5) == 10
+    assert len(ShardedJsonRepository[Student](shard_dir, Student, 5).get_all()) == 10
+
+    assert reshard(str(source), shard_dir, 0) == 10
+    assert not os.path.exists(shard_dir)
+    assert len(json.loads(source.read_text(encoding="utf-8"))) == 10
+
+
+def test_create_app_does_not_touch_storage(tmp_path, monkeypatch):
+    # CLI commands such as reshard build the app while the layout is mismatched
+    monkeypatch.setattr(TestingConfig, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(TestingConfig, "STUDENT_SHARDS", 3)
+    create_app("testing")
+    assert os.listdir(tmp_path) == []
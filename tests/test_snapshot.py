@@ -0,0 +1,76 @@
+"""
+Tests for the binary snapshot format and repository.
+"""
+import json
+
+import pytest
+
+from app.models.student import Student
+from app.repositories.base_repository import VersionConflictError
+from app.repositories.snapshot import Snapshot, json_to_snapshot, snapshot_to_json, write_snapshot
+from app.repositories.snapshot_repository import SnapshotRepository
+
+RECORDS = [
+    {"id": "b", "first_name": "Zoë", "is_active": True, "version": 3},
+    {"id": "a", "first_name": "Ann", "is_active": False},
+    {"id": "c", "first_name": "", "is_active": True},
+]
+
+
+def test_lazy_decoding_and_lookups(tmp_path):
+    path = str(tmp_path / "s.snap")
+    write_snapshot(path, RECORDS)
+    snapshot = Snapshot(path)
+
+    assert len(snapshot) == 3
+    assert list(snapshot.records()) == RECORDS
+    assert snapshot.value(0, "first_name") == "Zoë"
+    assert snapshot.value(1, "version") is None
+    assert snapshot.find_id("a") == 1
+    assert snapshot.find_id("missing") is None
+    assert snapshot.find("first_name", "") == 2
+
+
+def test_json_round_trip(tmp_path):
+    source = tmp_path / "in.json"
+    source.write_text(json.dumps(RECORDS), encoding="utf-8")
+    assert json_to_snapshot(str(source), str(tmp_path / "s.snap")) == 3
+    assert snapshot_to_json(str(tmp_path / "s.snap"), str(tmp_path / "out.json")) == 3
+    assert json.loads((tmp_path / "out.json").read_text(encoding="utf-8")) == RECORDS
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "bad.snap"
+    path.write_bytes(b"not a snapshot at all")
+    with pytest.raises(ValueError):
+        Snapshot(str(path))
+
+
+def test_repository_crud(tmp_path):
+    path = str(tmp_path / "students.snap")
+    repo = SnapshotRepository[Student](path, Student)
+    student = Student(id="s1", first_name="A", last_name="B", email="a@example.com", course="CS")
+    repo.create(student)
+
+    # a second instance sees the write through the shared, remapped snapshot
+    other = SnapshotRepository[Student](path, Student)
+    assert other.get_by_id("s1") == student
+    assert other.get_by_field("email", "a@example.com").id == "s1"
+
+    assert repo.update_fields("s1", {"course": "Maths"}, expected_version=1).version == 2
+    with pytest.raises(VersionConflictError):
+        repo.update_fields("s1", {"course": "Art"}, expected_version=1)
+    assert other.get_by_id("s1").course == "Maths"
+
+    assert repo.delete("s1")
+    assert other.get_all() == []
+
+
+def test_repository_refuses_to_shadow_json_source(tmp_path):
+    (tmp_path / "students.json").write_text(json.dumps(RECORDS), encoding="utf-8")
+    with pytest.raises(RuntimeError, match="flask snapshot build"):
+        SnapshotRepository[Student](str(tmp_path / "students.snap"), Student)
+    assert not (tmp_path / "students.snap").exists()
+
+    # collections with no JSON source, such as jobs, start empty
+    assert SnapshotRepository[Student](str(tmp_path / "jobs.snap"), Student).get_all() == []
@@ -1,32 +1,30 @@
 """
 Tests for /api/v1/students endpoints.
 """
+import json
+import multiprocessing
 
-SAMPLE_STUDENT = {
-    "first_name": "Alice",
-    "last_name": "Smith",
-    "email": "alice@example.com",
-    "course": "Computer Science",
-}
+from app.repositories.sharded_repository import reshard
+from app.repositories.snapshot import json_to_snapshot
 
 
-def test_create_student(client, auth_headers):
-    resp = client.post("/api/v1/students", json=SAMPLE_STUDENT, headers=auth_headers)
+def test_create_student(client, auth_headers, sample_student):
+    resp = client.post("/api/v1/students", json=sample_student, headers=auth_headers)
     assert resp.status_code == 201
     data = resp.get_json()
     assert data["student"]["email"] == "alice@example.com"
 
 
-def test_list_students(client, auth_headers):
-    client.post("/api/v1/students", json=SAMPLE_STUDENT, headers=auth_headers)
+def test_list_students(client, auth_headers, sample_student):
+    client.post("/api/v1/students", json=sample_student, headers=auth_headers)
     resp = client.get("/api/v1/students", headers=auth_headers)
     assert resp.status_code == 200
     assert resp.get_json()["count"] >= 1
 
 
-def test_get_student(client, auth_headers):
+def test_get_student(client, auth_headers, sample_student):
     create_resp = client.post("/api/v1/students", json={
-        **SAMPLE_STUDENT, "email": "bob@example.com"
+        **sample_student, "email": "bob@example.com"
     }, headers=auth_headers)
     sid = create_resp.get_json()["student"]["id"]
 
@@ -35,9 +33,9 @@ def test_get_student(client, auth_headers):
     assert resp.get_json()["id"] == sid
 
 
-def test_update_student(client, auth_headers):
+def test_update_student(client, auth_headers, sample_student):
     create_resp = client.post("/api/v1/students", json={
-        **SAMPLE_STUDENT, "email": "charlie@example.com"
+        **sample_student, "email": "charlie@example.com"
     }, headers=auth_headers)
     sid = create_resp.get_json()["student"]["id"]
 
@@ -48,9 +46,9 @@ def test_update_student(client, auth_headers):
     assert resp.get_json()["student"]["course"] == "Mathematics"
 
 
-def test_delete_student(client, auth_headers):
+def test_delete_student(client, auth_headers, sample_student):
     create_resp = client.post("/api/v1/students", json={
-        **SAMPLE_STUDENT, "email": "dave@example.com"
+        **sample_student, "email": "dave@example.com"
     }, headers=auth_headers)
     sid = create_resp.get_json()["student"]["id"]
 
@@ -64,3 +62,164 @@ def test_delete_student(client, auth_headers):
 def test_students_require_auth(client):
     resp = client.get("/api/v1/students")
     assert resp.status_code == 401
+
+
+def test_create_student_validation_reports_all_fields(client, auth_headers):
+    resp = client.post("/api/v1/students", json={
+        "first_name": "  ", "last_name": 42, "email": "not-an-email",
+    }, headers=auth_headers)
+    assert resp.status_code == 400
+    fields = resp.get_json()["fields"]
+    assert set(fields) == {"first_name", "last_name", "email", "course"}
+
+
+def test_update_student_rejects_bad_types(client, auth_headers, sample_student):
+    create_resp = client.post("/api/v1/students", json={
+        **sample_student, "email": "erin@example.com"
+    }, headers=auth_headers)
+    sid = create_resp.get_json()["student"]["id"]
+
+    resp = client.put(f"/api/v1/students/{sid}", json={
+        "is_active": "yes", "course": ["Maths"]
+    }, headers=auth_headers)
+    assert resp.status_code == 400
+    assert set(resp.get_json()["fields"]) == {"is_active", "course"}
+
+    resp = client.get(f"/api/v1/students/{sid}", headers=auth_headers)
+    assert resp.get_json()["course"] == sample_student["course"]
+
+
+def test_patch_student_with_if_match(client, auth_headers, sample_student):
+    create_resp = client.post("/api/v1/students", json={
+        **sample_student, "email": "frank@example.com"
+    }, headers=auth_headers)
+    sid = create_resp.get_json()["student"]["id"]
+    etag = create_resp.headers["ETag"]
+
+    resp = client.patch(f"/api/v1/students/{sid}", json={"course": "Physics"},
+                        headers={**auth_headers, "If-Match": etag})
+    assert resp.status_code == 200
+    student = resp.get_json()["student"]
+    assert student["course"] == "Physics"
+    assert student["first_name"] == sample_student["first_name"]
+    assert student["version"] == 2
+
+    # the original ETag is now stale
+    resp = client.patch(f"/api/v1/students/{sid}", json={"course": "Biology"},
+                        headers={**auth_headers, "If-Match": etag})
+    assert resp.status_code == 412
+    assert resp.get_json()["current_version"] == 2
+
+    resp = client.get(f"/api/v1/students/{sid}", headers=auth_headers)
+    assert resp.get_json()["course"] == "Physics"
+
+
+def test_patch_student_bad_if_match(client, auth_headers, sample_student):
+    create_resp = client.post("/api/v1/students", json={
+        **sample_student, "email": "grace@example.com"
+    }, headers=auth_headers)
+    sid = create_resp.get_json()["student"]["id"]
+
+    resp = client.patch(f"/api/v1/students/{sid}", json={"course": "Physics"},
+                        headers={**auth_headers, "If-Match": '"abc"'})
+    assert resp.status_code == 400
+
+
+def test_patch_student_rejects_field_removal(client, auth_headers, sample_student):
+    create_resp = client.post("/api/v1/students", json={
+        **sample_student, "email": "leo@example.com"
+    }, headers=auth_headers)
+    sid = create_resp.get_json()["student"]["id"]
+
+    resp = client.patch(f"/api/v1/students/{sid}", json={"course": None},
+                        headers=auth_headers)
+    assert resp.status_code == 400
+    assert resp.get_json()["fields"] == {"course": "course cannot be removed"}
+
+
+def test_patch_missing_student(client, auth_headers):
+    resp = client.patch("/api/v1/students/does-not-exist", json={"course": "Physics"},
+                        headers=auth_headers)
+    assert resp.status_code == 404
+
+
+def test_students_with_sharded_storage(app, client, auth_headers, tmp_path, sample_student):
+    app.config["DATA_DIR"] = str(tmp_path)
+    (tmp_path / "students.json").write_text(json.dumps([
+        {**sample_student, "id": "existing", "email": "existing@example.com"}
+    ]), encoding="utf-8")
+    reshard(str(tmp_path / "students.json"), str(tmp_path / "students_shards"), 4)
+    app.config["STUDENT_SHARDS"] = 4
+    create_resp = client.post("/api/v1/students", json={
+        **sample_student, "email": "heidi@example.com"
+    }, headers=auth_headers)
+    assert create_resp.status_code == 201
+    sid = create_resp.get_json()["student"]["id"]
+
+    resp = client.get(f"/api/v1/students/{sid}", headers=auth_headers)
+    assert resp.status_code == 200
+    resp = client.get("/api/v1/students", headers=auth_headers)
+    assert {sid, "existing"} <= {s["id"] for s in resp.get_json()["students"]}
+
+
+def test_students_with_snapshot_storage(app, client, auth_headers, tmp_path, sample_student):
+    (tmp_path / "students.json").write_text("[]", encoding="utf-8")
+    json_to_snapshot(str(tmp_path / "students.json"), str(tmp_path / "students.snap"))
+    app.config["DATA_DIR"] = str(tmp_path)
+    app.config["STORAGE_FORMAT"] = "snapshot"
+    create_resp = client.post("/api/v1/students", json={
+        **sample_student, "email": "ivan@example.com"
+    }, headers=auth_headers)
+    assert create_resp.status_code == 201
+    sid = create_resp.get_json()["student"]["id"]
+
+    resp = client.patch(f"/api/v1/students/{sid}", json={"is_active": False},
+                        headers={**auth_headers, "If-Match": create_resp.headers["ETag"]})
+    assert resp.status_code == 200
+    resp = client.get(f"/api/v1/students/{sid}", headers=auth_headers)
+    assert resp.get_json()["is_active"] is False
+
+
+def test_put_student_with_stale_if_match(client, auth_headers, sample_student):
+    create_resp = client.post("/api/v1/students", json={
+        **sample_student, "email": "judy@example.com"
+    }, headers=auth_headers)
+    sid = create_resp.get_json()["student"]["id"]
+    etag = create_resp.headers["ETag"]
+
+    resp = client.put(f"/api/v1/students/{sid}", json={"course": "Physics"},
+                      headers={**auth_headers, "If-Match": etag})
+    assert resp.status_code == 200
+
+    resp = client.put(f"/api/v1/students/{sid}", json={"course": "Biology"},
+                      headers={**auth_headers, "If-Match": etag})
+    assert resp.status_code == 412
+    resp = client.get(f"/api/v1/students/{sid}", headers=auth_headers)
+    assert resp.get_json()["course"] == "Physics"
+
+
+def test_concurrent_patches_across_processes(client, auth_headers, sample_student):
+    create_resp = client.post("/api/v1/students", json={
+        **sample_student, "email": "kim@example.com"
+    }, headers=auth_headers)
+    sid = create_resp.get_json()["student"]["id"]
+    etag = create_resp.headers["ETag"]
+
+    ctx = multiprocessing.get_context("fork")
+    barrier, results = ctx.Barrier(4), ctx.Queue()
+
+    def patch(course):
+        barrier.wait()
+        resp = client.patch(f"/api/v1/students/{sid}", json={"course": course},
+                            headers={**auth_headers, "If-Match": etag})
+        results.put(resp.status_code)
+
+    procs = [ctx.Process(target=patch, args=(f"Course {i}",)) for i in range(4)]
+    for p in procs:
+        p.start()
+    statuses = sorted(results.get(timeout=30) for _ in procs)
+    for p in procs:
+        p.join()
+
+    assert statuses == [200, 412, 412, 412]
+    assert client.get(f"/api/v1/students/{sid}", headers=auth_headers).get_json()["version"] == 2
@@ -0,0 +1,67 @@
+"""
+Tests for the async auth and student views (ASYNC_VIEWS=True).
+"""
+import pytest
+
+from app import create_app
+from app.config import TestingConfig
+
+
+@pytest.fixture()
+def app(monkeypatch):
+    monkeypatch.setattr(TestingConfig, "ASYNC_VIEWS", True)
+    yield create_app("testing")
+
+
+def test_async_views_are_registered(app):
+    assert "students_async.get_student" in app.view_functions
+    assert "students.get_student" not in app.view_functions
+    assert "auth_async.login" in app.view_functions
+    assert "auth.login" not in app.view_functions
+
+
+def test_async_register_and_login(client):
+    creds = {"username": "asyncuser", "password": "AsyncPass123!"}
+    resp = client.post("/api/v1/auth/register", json=creds)
+    assert resp.status_code in (201, 409)
+    assert client.post("/api/v1/auth/register", json=creds).status_code == 409
+
+    resp = client.post("/api/v1/auth/login", json=creds)
+    assert resp.status_code == 200
+    assert resp.get_json()["user"]["username"] == "asyncuser"
+    resp = client.post("/api/v1/auth/login", json={**creds, "password": "wrong-password"})
+    assert resp.status_code == 401
+
+
+def test_async_crud_round_trip(client, auth_headers, sample_student):
+    create_resp = client.post("/api/v1/students", json={
+        **sample_student, "email": "async@example.com"
+    }, headers=auth_headers)
+    assert create_resp.status_code == 201
+    sid = create_resp.get_json()["student"]["id"]
+
+    resp = client.post("/api/v1/students", json={
+        **sample_student, "email": "async@example.com"
+    }, headers=auth_headers)
+    assert resp.status_code == 409
+
+    resp = client.patch(f"/api/v1/students/{sid}", json={"course": "Physics"},
+                        headers={**auth_headers, "If-Match": create_resp.headers["ETag"]})
+    assert resp.status_code == 200
+    # the creation ETag is stale after the PATCH
+    resp = client.put(f"/api/v1/students/{sid}", json={"course": "Maths"},
+                      headers={**auth_headers, "If-Match": create_resp.headers["ETag"]})
+    assert resp.status_code == 412
+    assert resp.get_json()["current_version"] == 2
+
+    resp = client.get("/api/v1/students", headers=auth_headers)
+    assert sid in [s["id"] for s in resp.get_json()["students"]]
+
+    assert client.delete(f"/api/v1/students/{sid}", headers=auth_headers).status_code == 200
+    assert client.get(f"/api/v1/students/{sid}", headers=auth_headers).status_code == 404
+
+
+def test_async_routes_keep_bulk_endpoints(client, auth_headers, wait_for_job):
+    resp = client.post("/api/v1/students/export", headers=auth_headers)
+    assert resp.status_code == 202
+    assert wait_for_job(resp.headers["Location"])["status"] == "succeeded"
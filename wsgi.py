@@ -1,4 +1,10 @@
 """
 WSGI entry point for production servers (gunicorn).
 """
-from run import app  # noqa: F401
+from run import app
+from app.repositories.factory import warm_repositories
+
+# Warm repositories here rather than in create_app so CLI commands (e.g. reshard)
+# never load data; under gunicorn --preload this runs once in the master.
+if app.config["WARM_STORE"]:
+    warm_repositories(app.config)